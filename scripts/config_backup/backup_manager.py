@@ -13,12 +13,28 @@ Features:
 """
 
 import os
+import re
 import sys
+import io
+import gzip
 import json
+import time
+import random
+import shutil
+import hashlib
+import queue
 import logging
-from datetime import datetime
+import tempfile
+import threading
+import subprocess
+from datetime import datetime, date
 from pathlib import Path
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
 import difflib
+import functools
 import concurrent.futures
 
 try:
@@ -27,6 +43,18 @@ except ImportError:
     print("Error: netmiko library required. Install with: pip install netmiko")
     sys.exit(1)
 
+# Optional: only needed for --backend asyncssh
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+# Optional: faster encoding for --json output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
@@ -36,36 +64,770 @@ except ImportError:
     print("Error: config.py not found. Please ensure config.py exists in project root.")
     sys.exit(1)
 
+# Seconds an idle pooled SSH session is kept open before being disconnected
+CONNECTION_POOL_IDLE_TIMEOUT = getattr(config, 'CONNECTION_POOL_IDLE_TIMEOUT', 300)
+
+# Upper bound of the random delay before each new SSH connect, in seconds
+CONNECT_JITTER = 0.25
+
+# Write buffer for backup files, large enough to hold most configs in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Level 1 already shrinks running configs ~5-10x at negligible CPU cost
+GZIP_COMPRESSLEVEL = 1
+
+# Files belonging to a config backup: the config itself and its section-hash sidecar
+CONFIG_BACKUP_SUFFIXES = ('.txt', '.txt.gz', '.sections.json')
+
+# Per-device record of the latest config digest and the backup file it belongs to
+LATEST_HASH_FILE = '.latest.blake2b'
+
+# Exec prompt at the start of a line, e.g. 'R1#' or 'R1>'
+_PROMPT_RE = re.compile(r'^([\w.\-:/@()]+)[>#]', re.M)
+
+# show version lines kept in the info file, filtered locally instead of on the device
+_VERSION_RE = re.compile(r'^.*(?:uptime|Software|System).*$', re.M)
+
+RUNNING_CONFIG_COMMAND = 'show running-config'
+VERSION_COMMAND = 'show version'
+
+# Commands and show version filter per Netmiko device_type, shared by both
+# SSH backends; other platforms use the IOS defaults. The NX-OS and XR filters
+# keep their platforms' own version lines (NXOS/Chassis, processor) instead
+# of the IOS 'System' lines, so their info files differ from IOS-style output
+DEFAULT_PLATFORM_COMMANDS = (RUNNING_CONFIG_COMMAND, VERSION_COMMAND, _VERSION_RE)
+PLATFORM_COMMANDS = {
+    'cisco_ios': DEFAULT_PLATFORM_COMMANDS,
+    'cisco_nxos': (RUNNING_CONFIG_COMMAND, VERSION_COMMAND,
+                   re.compile(r'^.*(?:uptime|Software|NXOS|Chassis).*$', re.M)),
+    'cisco_xr': (RUNNING_CONFIG_COMMAND, VERSION_COMMAND,
+                 re.compile(r'^.*(?:uptime|Software|processor).*$', re.M)),
+}
+
+# Top-level config blocks start at column 0 with one of these keywords or a '!' separator
+_SECTION_RE = re.compile(r'^(?:interface|router|line|vlan|!)', re.M)
+_SECTION_BYTES_RE = re.compile(_SECTION_RE.pattern.encode(), re.M)
+
+HASH_CHUNK_SIZE = 1 << 20
+
+# Bytes requested per read from the SSH channel, same as Netmiko's MAX_BUFFER
+CHANNEL_RECV_SIZE = 65535
+
+# Below this many lines difflib beats the cost of spawning git
+GIT_DIFF_MIN_LINES = 2000
+_GIT = shutil.which('git')
+
+
+def _smart_open(path):
+    """Open a backup file for text reading, transparently handling .gz files"""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt')
+    return open(path, 'r')
+
+
+def _is_section_name(line):
+    """A section is named after its first line that is not blank or a bare '!'"""
+    return line not in ('', '!')
+
+
+def _split_sections(config_text):
+    """
+    Split a running config into top-level sections
+    
+    Returns:
+        list: (name, text) tuples in config order; name is the section's
+        first line that is not a bare '!', suffixed with #n when it
+        repeats (e.g. '!#3')
+    """
+    starts = [0] + [m.start() for m in _SECTION_RE.finditer(config_text) if m.start() > 0]
+    starts.append(len(config_text))
+    
+    sections = []
+    seen = defaultdict(int)
+    for start, end in zip(starts, starts[1:]):
+        text = config_text[start:end]
+        lines = [line.strip() for line in text.splitlines()]
+        name = next((line for line in lines if _is_section_name(line)), '!')
+        seen[name] += 1
+        if seen[name] > 1:
+            name = f"{name}#{seen[name]}"
+        sections.append((name, text))
+    return sections
+
+
+class _SectionHasher:
+    """
+    Incremental twin of _split_sections() that only keeps section hashes
+    
+    Produces the same names as _split_sections() and hashes exactly the
+    same text, so sidecars from either path compare equal. Works on raw
+    bytes; only candidate section names are decoded.
+    """
+    
+    def __init__(self):
+        self._partial = b''
+        self._sections = []
+        self._seen = defaultdict(int)
+        self._name = None
+        self._digest = None
+    
+    def _close_section(self):
+        if self._digest is None:
+            return
+        name = self._name or '!'
+        self._seen[name] += 1
+        if self._seen[name] > 1:
+            name = f"{name}#{self._seen[name]}"
+        self._sections.append([name, self._digest.hexdigest()])
+    
+    def _add_line(self, line):
+        if self._digest is None or _SECTION_BYTES_RE.match(line):
+            self._close_section()
+            self._name = None
+            self._digest = hashlib.blake2b(digest_size=16)
+        if self._name is None:
+            name = line.strip().decode(errors='replace')
+            if _is_section_name(name):
+                self._name = name
+        self._digest.update(line)
+    
+    def update(self, data):
+        """Feed the next chunk of config bytes"""
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._add_line(line + b'\n')
+    
+    def result(self):
+        """
+        Finish hashing
+        
+        Returns:
+            dict: 'sections' as [name, blake2b hex digest] pairs and 'root',
+            the digest over all section digests in order
+        """
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = b''
+        self._close_section()
+        self._digest = None
+        root = hashlib.blake2b(''.join(digest for _, digest in self._sections).encode(), digest_size=16)
+        return {'root': root.hexdigest(), 'sections': self._sections}
+
+
+class _ConfigSink:
+    """
+    Consume a running config chunk by chunk
+    
+    Every chunk is hashed, counted, gzip-compressed in memory and split
+    into sections as it arrives, so the full config is never held as one
+    uncompressed string. Chunks are raw channel bytes and are never decoded.
+    """
+    
+    def __init__(self):
+        self.size = 0
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._sections = _SectionHasher()
+        self._buffer = io.BytesIO()
+        self._gzip = gzip.GzipFile(fileobj=self._buffer, mode='wb', compresslevel=GZIP_COMPRESSLEVEL)
+    
+    def write(self, data):
+        """Feed the next chunk of config bytes"""
+        self.size += len(data)
+        self._digest.update(data)
+        self._gzip.write(data)
+        self._sections.update(data)
+    
+    def close(self):
+        """
+        Finish the stream
+        
+        Returns:
+            tuple: (blake2b hex digest, gzip member bytes, section hashes dict)
+        """
+        self._gzip.close()
+        return self._digest.hexdigest(), self._buffer.getvalue(), self._sections.result()
+
+
+def _sections_path(config_path):
+    """Sidecar holding the section hashes of a config backup"""
+    return config_path.with_name(re.sub(r'\.txt(\.gz)?$', '.sections.json', config_path.name))
+
+
+def _load_sections(config_path):
+    """Load a backup's section hashes, or None for backups without a sidecar"""
+    try:
+        with open(_sections_path(config_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_config_body(config_path):
+    """Read a config backup without the '# ...' metadata header"""
+    with _smart_open(config_path) as f:
+        text = f.read()
+    if text.startswith('# '):
+        header, sep, body = text.partition('\n\n')
+        if sep:
+            return body
+    return text
+
+
+def _header_end(data):
+    """Offset where the config body starts, skipping a '# ...' metadata header"""
+    if data[:2] == b'# ':
+        end = data.find(b'\n\n')
+        if end != -1:
+            return end + 2
+    return 0
+
+
+def _hash_config_body(path):
+    """
+    blake2b digest of a backup's config body, as recorded in LATEST_HASH_FILE
+    
+    The body is hashed in fixed-size chunks as it is decompressed, so the
+    whole configuration is never held in memory. Backups are stored
+    gzipped, which rules out hashing them through mmap.
+    
+    Args:
+        path (Path): Config backup file
+        
+    Returns:
+        str: blake2b hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with gzip.open(path, 'rb') if path.suffix == '.gz' else open(path, 'rb') as f:
+        chunk = f.read(HASH_CHUNK_SIZE)
+        digest.update(chunk[_header_end(chunk):])
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Hunk header as git prints it, '@@ -a,b +c,d @@' optionally followed by function context
+_HUNK_CONTEXT_RE = re.compile(r'^(@@ -\S+ \+\S+ @@).*$', re.M)
+
+
+def _git_diff(lines1, lines2, fromfile, tofile):
+    """
+    Unified diff computed by git's C implementation of Myers' algorithm
+    
+    Returns:
+        str: Diff with difflib-style headers, or None if git could not diff
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = (os.path.join(tmp_dir, 'a'), os.path.join(tmp_dir, 'b'))
+        for path, lines in zip(paths, (lines1, lines2)):
+            with open(path, 'w') as f:
+                # Trailing newline avoids git's "No newline at end of file" markers
+                f.write(''.join(f"{line}\n" for line in lines))
+        try:
+            result = subprocess.run(
+                [_GIT, 'diff', '--no-index', '--no-color', '--no-ext-diff', '--text', '--unified=3', *paths],
+                capture_output=True, text=True
+            )
+        except OSError:
+            return None
+    
+    # git diff exits 1 when the files differ, anything above is a failure
+    if result.returncode not in (0, 1):
+        return None
+    if not result.stdout:
+        return ''
+    
+    # Swap git's diff/index/---/+++ preamble for the labels difflib would print
+    hunks_start = result.stdout.find('\n@@')
+    if hunks_start == -1:
+        return None
+    
+    # Drop git's function context after the hunk ranges, difflib prints none;
+    # only the final newline goes, trailing whitespace is part of the diff
+    hunks = _HUNK_CONTEXT_RE.sub(r'\1', result.stdout[hunks_start:].rstrip('\n'))
+    return f"--- {fromfile}\n+++ {tofile}{hunks}"
+
+
+def _unified_diff(lines1, lines2, fromfile, tofile):
+    """
+    Unified diff of two line lists
+    
+    Large inputs are handed to git, small inputs and hosts without git
+    use difflib.
+    """
+    if _GIT and len(lines1) + len(lines2) >= GIT_DIFF_MIN_LINES:
+        diff = _git_diff(lines1, lines2, fromfile, tofile)
+        if diff is not None:
+            return diff
+    
+    return '\n'.join(difflib.unified_diff(
+        lines1,
+        lines2,
+        fromfile=fromfile,
+        tofile=tofile,
+        lineterm=''
+    ))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_diff(config1_path, config2_path, fromfile, tofile, mtime1_ns, mtime2_ns, diff_cache_path):
+    """
+    Diff two backup files, memoized in-process and persisted on disk
+    
+    Backups are immutable, so the file mtimes in the cache key are enough
+    to invalidate an entry if a backup is ever rewritten. A diff persisted
+    by an earlier process is reused while it is newer than both backups.
+    
+    When both backups have section-hash sidecars only the sections whose
+    hashes differ are diffed, so hunk line numbers are relative to the
+    changed sections rather than the whole file. If no section hash
+    differs but the roots do, the whole files are diffed.
+    """
+    config1_path, config2_path = Path(config1_path), Path(config2_path)
+    diff_cache = Path(diff_cache_path)
+    try:
+        if diff_cache.stat().st_mtime_ns >= max(mtime1_ns, mtime2_ns):
+            return diff_cache.read_text()
+    except OSError:
+        pass
+    
+    sections1, sections2 = _load_sections(config1_path), _load_sections(config2_path)
+    changed = None
+    if sections1 and sections2:
+        # Equal Merkle roots mean identical configs
+        if sections1['root'] == sections2['root']:
+            return ''
+        
+        hashes1, hashes2 = dict(sections1['sections']), dict(sections2['sections'])
+        changed = {name for name in hashes1.keys() | hashes2.keys()
+                   if hashes1.get(name) != hashes2.get(name)}
+    
+    if changed:
+        config1_lines, config2_lines = (
+            [line for name, text in _split_sections(_read_config_body(path)) if name in changed
+             for line in text.splitlines()]
+            for path in (config1_path, config2_path)
+        )
+    else:
+        # No sidecars, or the roots differ only because sections moved
+        with _smart_open(config1_path) as f:
+            config1_lines = f.read().splitlines()
+        with _smart_open(config2_path) as f:
+            config2_lines = f.read().splitlines()
+    
+    diff = _unified_diff(config1_lines, config2_lines, fromfile, tofile)
+    
+    # Persisting is best effort, the diff itself is already computed
+    try:
+        diff_cache.parent.mkdir(exist_ok=True)
+        diff_cache.write_text(diff)
+    except OSError:
+        pass
+    return diff
+
+
+def _read_channel_bytes(connection):
+    """
+    Read what the SSH channel has buffered without Netmiko's str decoding
+    
+    Telnet and serial sessions have no paramiko channel, so their data
+    goes through Netmiko's read_channel and is re-encoded.
+    
+    Returns:
+        bytes: Raw channel data, empty if nothing is waiting
+    """
+    channel = connection.remote_conn
+    if not hasattr(channel, 'recv_ready'):
+        return connection.read_channel().encode()
+    if channel.recv_ready():
+        return channel.recv(CHANNEL_RECV_SIZE)
+    return b''
+
+
+def _stream_show(connection, commands, sinks, read_timeout=120):
+    """
+    Run several show commands in a single write/read cycle, streaming output
+    
+    All commands are written to the channel at once so the batch pays one
+    prompt-detection round trip. Output is handed to each command's sink
+    line by line while it arrives; only the current partial line is
+    buffered. Output stays as raw bytes end to end.
+    
+    Args:
+        connection: Connected Netmiko session
+        commands (list): Show commands to run, in order
+        sinks (list): Objects with a write(bytes) method, one per command
+        read_timeout (int): Seconds to wait for the last prompt
+    """
+    prompt_re = re.compile(rb'^' + re.escape(connection.base_prompt.encode()) + rb'[>#]', re.M)
+    
+    connection.clear_buffer()
+    connection.write_channel(connection.RETURN.join(commands) + connection.RETURN)
+    
+    pending = b''
+    index = 0
+    in_echo = True
+    deadline = time.monotonic() + read_timeout
+    while index < len(commands):
+        chunk = _read_channel_bytes(connection)
+        if not chunk:
+            if time.monotonic() > deadline:
+                raise NetmikoTimeoutException(f"Timed out waiting for prompt after '{commands[index]}'")
+            time.sleep(0.05)
+            continue
+        
+        # pending never holds more than one partial line, so this stays cheap
+        pending = (pending + chunk).replace(b'\r\n', b'\n')
+        while index < len(commands):
+            if in_echo:
+                # First line of each command's output is its echo
+                newline = pending.find(b'\n')
+                if newline == -1:
+                    break
+                pending = pending[newline + 1:]
+                in_echo = False
+            
+            match = prompt_re.search(pending)
+            if match:
+                sinks[index].write(pending[:match.start()].rstrip(b'\n'))
+                pending = pending[match.end():]
+                index += 1
+                in_echo = True
+                continue
+            
+            # Hold back the last newline and partial line, they may precede the prompt
+            last_newline = pending.rfind(b'\n')
+            if last_newline > 0:
+                sinks[index].write(pending[:last_newline])
+                pending = pending[last_newline:]
+            break
+
+
+def _run_backup(connection, commands):
+    """
+    Stream a backup's commands over a Netmiko session
+    
+    Args:
+        connection: Connected Netmiko session
+        commands (list): Running config command, optionally followed by the version command
+        
+    Returns:
+        tuple: (_ConfigSink holding the config, version output or None if not requested)
+    """
+    config_sink = _ConfigSink()
+    if len(commands) == 1:
+        _stream_show(connection, commands, [config_sink])
+        return config_sink, None
+    
+    # Only the short version output is decoded, for the info file
+    version_sink = io.BytesIO()
+    _stream_show(connection, commands, [config_sink, version_sink])
+    return config_sink, version_sink.getvalue().decode(errors='replace')
+
+
+def _slice_on_prompts(output, prompts, start=0):
+    """
+    Cut pipelined command output into one chunk per command
+    
+    Args:
+        output (str): Raw channel output, beginning with the first command echo at start
+        prompts (list): Prompt matches terminating each command's output
+        start (int): Offset of the first command echo
+        
+    Returns:
+        list: Output of each command with echo and prompt stripped
+    """
+    results = []
+    for match in prompts:
+        segment = output[start:match.start()].replace('\r\n', '\n')
+        # First line of each segment is the echoed command
+        results.append(segment.split('\n', 1)[1].rstrip('\n') if '\n' in segment else '')
+        start = match.end()
+    return results
+
+
+async def _asyncssh_show(device_info, commands, read_timeout=120):
+    """
+    Run show commands over an asyncssh interactive shell
+    
+    IOS closes the connection after a single exec request, so the
+    commands are pipelined into one shell session exactly like
+    _stream_show() does over Netmiko.
+    
+    Args:
+        device_info (dict): Device connection parameters
+        commands (list): Show commands to run, in order
+        read_timeout (int): Seconds to wait for the session to finish
+        
+    Returns:
+        list: Output of each command with echo and prompt stripped
+    """
+    async with asyncssh.connect(
+        device_info['host'],
+        port=device_info.get('port', 22),
+        username=device_info.get('username'),
+        password=device_info.get('password'),
+        known_hosts=None,
+        connect_timeout=device_info.get('conn_timeout', 10)
+    ) as conn:
+        process = await conn.create_process(term_type='vt100')
+        process.stdin.write('\n'.join(['terminal length 0', *commands, 'exit']) + '\n')
+        output = (await asyncio.wait_for(process.stdout.read(), read_timeout)).replace('\r\n', '\n')
+    
+    # The first prompt after the login banner tells us what to split on
+    first_prompt = _PROMPT_RE.search(output)
+    if first_prompt is None:
+        raise asyncio.TimeoutError(f"No prompt received from {device_info['host']}")
+    prompt_re = re.compile(rf'^{re.escape(first_prompt.group(1))}[>#]', re.M)
+    
+    # Prompts: before 'terminal length 0', before each command, before 'exit'
+    prompts = list(prompt_re.finditer(output, first_prompt.start()))
+    if len(prompts) < len(commands) + 2:
+        raise asyncio.TimeoutError(f"Session to {device_info['host']} ended before all commands completed")
+    return _slice_on_prompts(output, prompts[2:len(commands) + 2], start=prompts[1].end())
+
+
+def _atomic_symlink(target, link):
+    """
+    Point link at target without a window where link is missing
+    
+    Args:
+        target (str): Link target, relative to the link's directory
+        link (Path): Symlink to create or replace
+    """
+    tmp_link = link.with_suffix('.tmp')
+    if tmp_link.is_symlink() or tmp_link.exists():
+        tmp_link.unlink()
+    os.symlink(target, tmp_link)
+    os.replace(tmp_link, link)
+
+
+def _atomic_latest_link(target, link):
+    """
+    Swap a latest link and drop the legacy link it supersedes
+    
+    Installs from before gzip backups kept {hostname}_latest_config.txt,
+    which would otherwise keep pointing at the last plain-text backup.
+    
+    Args:
+        target (str): Link target, relative to the link's directory
+        link (Path): Latest symlink to create or replace
+    """
+    _atomic_symlink(target, link)
+    if link.suffix == '.gz':
+        legacy_link = link.with_suffix('')
+        if legacy_link.is_symlink():
+            legacy_link.unlink()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many actions start per second
+    """
+    
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable Netmiko connections
+
+    Connections are keyed by (host, port, username, device_type) so repeated
+    backups of the same device skip the TCP + SSH handshake. A background
+    reaper disconnects sessions that stay idle longer than idle_timeout.
+    """
+    
+    def __init__(self, idle_timeout=CONNECTION_POOL_IDLE_TIMEOUT, connect=ConnectHandler):
+        self.idle_timeout = idle_timeout
+        self._connect = connect
+        self._idle = defaultdict(deque)  # key -> deque of (connection, last_used_ts)
+        self._in_use = {}                # id(connection) -> key
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._reaper = threading.Thread(target=self._reap_idle, name='pool-reaper', daemon=True)
+        self._reaper.start()
+    
+    @staticmethod
+    def _pool_key(device_info):
+        """Build the pool key for a device"""
+        return (
+            device_info['host'],
+            device_info.get('port', 22),
+            device_info.get('username'),
+            device_info.get('device_type')
+        )
+    
+    @staticmethod
+    def _disconnect(connection):
+        """Disconnect a session, ignoring errors from already dead channels"""
+        try:
+            connection.disconnect()
+        except Exception:
+            pass
+    
+    def _checkout(self, key):
+        """Return a validated idle connection for key, or None if none is alive"""
+        while True:
+            with self._lock:
+                if not self._idle[key]:
+                    return None
+                connection, _ = self._idle[key].pop()
+            
+            # Validate outside the lock - find_prompt is a network round trip
+            try:
+                connection.find_prompt()
+                return connection
+            except Exception:
+                self._disconnect(connection)
+    
+    @contextmanager
+    def acquire(self, device_info):
+        """
+        Acquire a live connection for a device
+        
+        Args:
+            device_info (dict): Device connection parameters
+            
+        Yields:
+            ConnectHandler: Connected Netmiko session, returned to the pool on exit
+        """
+        key = self._pool_key(device_info)
+        connection = self._checkout(key)
+        if connection is None:
+            connection = self._connect(**device_info)
+        
+        with self._lock:
+            self._in_use[id(connection)] = key
+        
+        try:
+            yield connection
+        except Exception:
+            # Channel state is unknown after a failure, never hand it out again
+            with self._lock:
+                self._in_use.pop(id(connection), None)
+            self._disconnect(connection)
+            raise
+        else:
+            self.release(connection)
+    
+    def release(self, connection):
+        """Return a connection to the pool"""
+        with self._lock:
+            key = self._in_use.pop(id(connection), None)
+            if key is not None and not self._closed.is_set():
+                self._idle[key].append((connection, time.monotonic()))
+                return
+        self._disconnect(connection)
+    
+    def _reap_idle(self):
+        """Background loop disconnecting sessions idle past idle_timeout"""
+        interval = max(1, min(self.idle_timeout, 30))
+        while not self._closed.wait(interval):
+            cutoff = time.monotonic() - self.idle_timeout
+            expired = []
+            with self._lock:
+                for key, entries in self._idle.items():
+                    fresh = deque(entry for entry in entries if entry[1] >= cutoff)
+                    expired.extend(entry[0] for entry in entries if entry[1] < cutoff)
+                    self._idle[key] = fresh
+            for connection in expired:
+                self._disconnect(connection)
+    
+    def close(self):
+        """Stop the reaper and disconnect every idle session"""
+        self._closed.set()
+        with self._lock:
+            idle = [entry[0] for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+        for connection in idle:
+            self._disconnect(connection)
+
 
 class CiscoBackupManager:
     """
     Manages automated backups of Cisco device configurations
     """
     
-    def __init__(self, backup_dir="configs/backups"):
+    def __init__(self, backup_dir="configs/backups", durable=False, max_workers=5, connect_rate=None,
+                 log_stream=sys.stdout):
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self.setup_logging()
+        self.durable = durable
+        self.setup_logging(log_stream)
+        
+        # Filtered show version output per (hostname, day)
+        self._version_cache = {}
+        
+        # Each platform's commands and show version filter bound once, looked up once per backup
+        self._platforms = {
+            device_type: self._bind_platform(*commands) for device_type, commands in PLATFORM_COMMANDS.items()
+        }
+        self._generic_platform = self._bind_platform(*DEFAULT_PLATFORM_COMMANDS)
+        
+        # Bound and pace new SSH handshakes so they do not hit devices all at once
+        self._connect_sem = threading.BoundedSemaphore(max_workers)
+        self._connect_bucket = TokenBucket(connect_rate) if connect_rate else None
+        self.pool = ConnectionPool(connect=self.open_connection)
+        
+        # Batch runs queue file writes and symlink swaps here so workers only do network I/O
+        self._defer_writes = False
+        self._pending_writes = []
+        self._pending_symlinks = {}  # link -> target, later swaps of the same link win
+        self._pending_unchanged = []  # (latest link, history file, history line)
+        self._pending_lock = threading.Lock()
         self.stats = {
             'successful': 0,
+            'unchanged': 0,
             'failed': 0,
             'total_devices': 0,
             'start_time': datetime.now()
         }
     
-    def setup_logging(self):
-        """Configure logging for backup operations"""
+    def setup_logging(self, log_stream=sys.stdout):
+        """Configure logging for backup operations, echoing records to log_stream"""
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / 'backup_manager.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # threadName keeps records from concurrent workers attributable
+        formatter = logging.Formatter('%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler(log_dir / 'backup_manager.log'),
+            logging.StreamHandler(log_stream)
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Workers only enqueue records; the listener thread does the actual I/O.
+        # The handler is attached directly rather than through basicConfig,
+        # which ignores every manager after the first, and removed in close()
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(log_queue)
+        self._queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(self._queue_handler)
+        self._log_listener = QueueListener(log_queue, *handlers)
+        self._log_listener.start()
         self.logger = logging.getLogger(__name__)
     
     def create_device_directory(self, hostname):
@@ -74,9 +836,188 @@ class CiscoBackupManager:
         device_dir.mkdir(exist_ok=True)
         return device_dir
     
-    def get_timestamp(self):
-        """Generate timestamp for backup files"""
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+    def open_connection(self, **device_info):
+        """
+        Open a new SSH connection with bounded, jittered and rate-limited handshakes
+        
+        Args:
+            **device_info: Netmiko ConnectHandler parameters
+            
+        Returns:
+            ConnectHandler: Connected Netmiko session
+        """
+        with self._connect_sem:
+            if self._connect_bucket:
+                self._connect_bucket.acquire()
+            time.sleep(random.uniform(0, CONNECT_JITTER))
+            return ConnectHandler(**device_info)
+    
+    def _write_bytes(self, path, data):
+        """Write bytes to disk, syncing only when durable mode is enabled"""
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def write_file(self, path, data):
+        """
+        Write a backup file, or queue it while a batch run is in progress
+        
+        Args:
+            path (Path): Destination file
+            data (bytes): File contents
+        """
+        if self._defer_writes:
+            with self._pending_lock:
+                self._pending_writes.append((path, data))
+        else:
+            self._write_bytes(path, data)
+    
+    def update_latest_link(self, target, link):
+        """
+        Atomically repoint a latest symlink, or queue it during a batch run
+        
+        Args:
+            target (str): Backup filename the link should point to
+            link (Path): Latest symlink path
+        """
+        if self._defer_writes:
+            with self._pending_lock:
+                self._pending_symlinks[link] = target
+        else:
+            _atomic_latest_link(target, link)
+    
+    def _touch_unchanged(self, latest_config, history_path, line):
+        """Refresh the latest backup's mtime and append a history line"""
+        os.utime(latest_config)
+        with open(history_path, 'a') as f:
+            f.write(line)
+    
+    def record_unchanged(self, latest_config, history_path, line):
+        """
+        Record an unchanged backup, or queue it while a batch run is in progress
+        
+        Args:
+            latest_config (Path): Latest config symlink, its target gets touched
+            history_path (Path): Device history file
+            line (str): JSON line to append
+        """
+        if self._defer_writes:
+            with self._pending_lock:
+                self._pending_unchanged.append((latest_config, history_path, line))
+        else:
+            self._touch_unchanged(latest_config, history_path, line)
+    
+    def flush_pending_writes(self):
+        """
+        Write every queued backup file, then apply queued symlink swaps
+        and unchanged-backup records
+        
+        Returns:
+            set: Paths (as str) that could not be written
+        """
+        with self._pending_lock:
+            pending, self._pending_writes = self._pending_writes, []
+            symlinks, self._pending_symlinks = self._pending_symlinks, {}
+            unchanged, self._pending_unchanged = self._pending_unchanged, []
+        
+        failed = set()
+        for path, data in pending:
+            try:
+                self._write_bytes(path, data)
+            except OSError as e:
+                self.logger.error(f"Failed to write {path}: {str(e)}")
+                failed.add(str(path))
+        
+        for link, target in symlinks.items():
+            # Never point a latest link at a file that failed to write
+            if str(link.parent / target) in failed:
+                continue
+            try:
+                _atomic_latest_link(target, link)
+            except OSError as e:
+                self.logger.error(f"Failed to update {link}: {str(e)}")
+        
+        for latest_config, history_path, line in unchanged:
+            try:
+                self._touch_unchanged(latest_config, history_path, line)
+            except OSError as e:
+                self.logger.error(f"Failed to record unchanged backup in {history_path}: {str(e)}")
+                failed.add(str(history_path))
+        return failed
+    
+    def find_unchanged_backup(self, device_dir, latest_config, digest):
+        """
+        Find the latest backup if it holds exactly the given configuration
+        
+        Args:
+            device_dir (Path): Device backup directory
+            latest_config (Path): Latest config symlink
+            digest (str): blake2b hex digest of the new configuration
+            
+        Returns:
+            Path: Latest backup file, or None if the config changed or is unknown
+        """
+        try:
+            target_name = os.readlink(latest_config)
+        except OSError:
+            return None
+        target = device_dir / target_name
+        
+        try:
+            recorded_digest, recorded_name = (device_dir / LATEST_HASH_FILE).read_text().split()
+        except (OSError, ValueError):
+            recorded_digest = recorded_name = None
+        
+        # The digest only vouches for the file it was recorded with; otherwise hash the file itself
+        try:
+            if recorded_name != target_name:
+                recorded_digest = _hash_config_body(target)
+            if recorded_digest == digest and target.exists():
+                return target
+        except OSError:
+            pass
+        return None
+    
+    def _bind_platform(self, running_cmd, version_cmd, version_re):
+        """
+        Specialize the backup helpers for one platform with functools.partial
+        
+        Returns:
+            tuple: (backup_commands(hostname), device_info_from_version(hostname, version_output))
+        """
+        return (
+            functools.partial(self._backup_commands, running_cmd=running_cmd, version_cmd=version_cmd),
+            functools.partial(self._device_info_from_version, version_re=version_re)
+        )
+    
+    def _backup_commands(self, hostname, running_cmd, version_cmd):
+        """
+        Commands to run for a backup and the cached device info, if any
+        
+        show version rarely changes, so a long-lived manager only fetches it
+        on the first backup of a device each day.
+        
+        Returns:
+            tuple: (list of commands, cached info output or None)
+        """
+        cached_info = self._version_cache.get((hostname, date.today()))
+        if cached_info is not None:
+            return [running_cmd], cached_info
+        return [running_cmd, version_cmd], None
+    
+    def _device_info_from_version(self, hostname, version_output, version_re):
+        """Filter show version down to the info file lines and cache the result for today"""
+        device_info_output = '\n'.join(version_re.findall(version_output))
+        
+        # Entries from earlier days can never hit again
+        today = date.today()
+        for key in list(self._version_cache):
+            if key[1] != today:
+                self._version_cache.pop(key, None)
+        self._version_cache[(hostname, today)] = device_info_output
+        return device_info_output
     
     def backup_device_config(self, device_info):
         """
@@ -92,91 +1033,186 @@ class CiscoBackupManager:
         self.logger.info(f"Starting backup for {hostname}")
         
         try:
-            # Establish connection
-            connection = ConnectHandler(**device_info)
-            self.logger.info(f"Connected to {hostname}")
+            backup_commands, device_info_from_version = self._platforms.get(
+                device_info.get('device_type'), self._generic_platform
+            )
+            commands, device_info_output = backup_commands(hostname)
             
-            # Get running configuration
-            config_output = connection.send_command('show running-config')
+            # Reuse a pooled connection when one is alive
+            with self.pool.acquire(device_info) as connection:
+                self.logger.info(f"Connected to {hostname}")
+                
+                # Stream running configuration and device info for metadata in one cycle
+                config_sink, version_output = _run_backup(connection, commands)
             
-            # Get device info for metadata
-            device_info_output = connection.send_command('show version | include uptime|Software|System')
+            if device_info_output is None:
+                device_info_output = device_info_from_version(hostname, version_output)
+            return self.save_backup(hostname, config_sink, device_info_output)
             
-            # Close connection
-            connection.disconnect()
+        except NetmikoAuthenticationException as e:
+            return self._backup_failed(hostname, 'auth_error', f"Authentication failed for {hostname}: {str(e)}")
             
-            # Create device directory
-            device_dir = self.create_device_directory(hostname)
+        except NetmikoTimeoutException as e:
+            return self._backup_failed(hostname, 'timeout_error', f"Connection timeout for {hostname}: {str(e)}")
             
-            # Generate filename with timestamp
-            timestamp = self.get_timestamp()
-            config_filename = f"{hostname}_config_{timestamp}.txt"
-            info_filename = f"{hostname}_info_{timestamp}.txt"
+        except Exception as e:
+            return self._backup_failed(hostname, 'error', f"Unexpected error backing up {hostname}: {str(e)}")
+    
+    async def backup_device_config_async(self, device_info):
+        """
+        Backup configuration from a single device over asyncssh
+        
+        Args:
+            device_info (dict): Device connection parameters
             
-            # Save configuration
-            config_path = device_dir / config_filename
-            with open(config_path, 'w') as f:
-                f.write(f"# Configuration backup for {hostname}\n")
-                f.write(f"# Backup date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Device: {hostname}\n\n")
-                f.write(config_output)
+        Returns:
+            dict: Backup result with status and details
+        """
+        hostname = device_info.get('hostname', device_info['host'])
+        self.logger.info(f"Starting backup for {hostname}")
+        
+        try:
+            if self._connect_bucket:
+                await asyncio.to_thread(self._connect_bucket.acquire)
+            await asyncio.sleep(random.uniform(0, CONNECT_JITTER))
             
-            # Save device info
-            info_path = device_dir / info_filename
-            with open(info_path, 'w') as f:
-                f.write(f"# Device information for {hostname}\n")
-                f.write(f"# Backup date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(device_info_output)
+            backup_commands, device_info_from_version = self._platforms.get(
+                device_info.get('device_type'), self._generic_platform
+            )
+            commands, device_info_output = backup_commands(hostname)
+            config_output, *version_output = await _asyncssh_show(device_info, commands)
+            if device_info_output is None:
+                device_info_output = device_info_from_version(hostname, version_output[0])
             
-            # Create latest symlinks for easy access
-            latest_config = device_dir / f"{hostname}_latest_config.txt"
-            latest_info = device_dir / f"{hostname}_latest_info.txt"
+            # Hashing and compression stay off the event loop
+            return await asyncio.to_thread(self._save_backup_text, hostname, config_output, device_info_output)
             
-            if latest_config.exists():
-                latest_config.unlink()
-            if latest_info.exists():
-                latest_info.unlink()
-                
-            latest_config.symlink_to(config_filename)
-            latest_info.symlink_to(info_filename)
+        except asyncssh.PermissionDenied as e:
+            return self._backup_failed(hostname, 'auth_error', f"Authentication failed for {hostname}: {str(e)}")
             
-            self.stats['successful'] += 1
-            self.logger.info(f"Successfully backed up {hostname}")
+        except (asyncio.TimeoutError, asyncssh.ConnectionLost) as e:
+            return self._backup_failed(hostname, 'timeout_error', f"Connection timeout for {hostname}: {str(e)}")
             
+        except Exception as e:
+            return self._backup_failed(hostname, 'error', f"Unexpected error backing up {hostname}: {str(e)}")
+    
+    def _backup_failed(self, hostname, status, error_msg):
+        """Log and count a failed backup, returning its result dict"""
+        self.logger.error(error_msg)
+        self.stats['failed'] += 1
+        return {'hostname': hostname, 'status': status, 'error': error_msg}
+    
+    def _save_backup_text(self, hostname, config_output, device_info_output):
+        """Store a configuration that was fetched as a single string"""
+        config_sink = _ConfigSink()
+        config_sink.write(config_output.encode())
+        return self.save_backup(hostname, config_sink, device_info_output)
+    
+    def save_backup(self, hostname, config_sink, device_info_output):
+        """
+        Store fetched configuration and device info for a device
+        
+        Args:
+            hostname (str): Device hostname
+            config_sink (_ConfigSink): Sink that received the running configuration
+            device_info_output (str): Filtered show version output
+            
+        Returns:
+            dict: Backup result with status and details
+        """
+        config_digest, config_gzip, config_sections = config_sink.close()
+        
+        # One clock read so the filename and header timestamps always match
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        backup_date = now.strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Create device directory
+        device_dir = self.create_device_directory(hostname)
+        
+        # Generate filename with timestamp
+        config_filename = f"{hostname}_config_{timestamp}.txt.gz"
+        info_filename = f"{hostname}_info_{timestamp}.txt"
+        
+        config_path = device_dir / config_filename
+        info_path = device_dir / info_filename
+        latest_config = device_dir / f"{hostname}_latest_config.txt.gz"
+        latest_info = device_dir / f"{hostname}_latest_info.txt"
+        
+        # An unchanged configuration only refreshes the latest backup and logs a history entry
+        unchanged_path = self.find_unchanged_backup(device_dir, latest_config, config_digest)
+        if unchanged_path is not None:
+            self.record_unchanged(
+                latest_config,
+                device_dir / f"{hostname}_history.jsonl",
+                json.dumps({'ts': now.isoformat(timespec='seconds'), 'hash': config_digest}) + '\n'
+            )
+            self.stats['unchanged'] += 1
+            self.logger.info(f"Configuration unchanged for {hostname}, kept {unchanged_path.name}")
+            
+            # timestamp names the kept backup, so compare_configs() can find it
+            kept_timestamp = unchanged_path.name[len(f"{hostname}_config_"):].split('.txt')[0]
             return {
                 'hostname': hostname,
-                'status': 'success',
-                'config_file': str(config_path),
-                'info_file': str(info_path),
-                'timestamp': timestamp,
-                'config_size': len(config_output)
+                'status': 'unchanged',
+                'config_file': str(unchanged_path),
+                'info_file': str(latest_info),
+                'timestamp': kept_timestamp,
+                'checked_at': timestamp,
+                'config_size': config_sink.size
             }
-            
-        except NetmikoAuthenticationException as e:
-            error_msg = f"Authentication failed for {hostname}: {str(e)}"
-            self.logger.error(error_msg)
-            self.stats['failed'] += 1
-            return {'hostname': hostname, 'status': 'auth_error', 'error': error_msg}
-            
-        except NetmikoTimeoutException as e:
-            error_msg = f"Connection timeout for {hostname}: {str(e)}"
-            self.logger.error(error_msg)
-            self.stats['failed'] += 1
-            return {'hostname': hostname, 'status': 'timeout_error', 'error': error_msg}
-            
-        except Exception as e:
-            error_msg = f"Unexpected error backing up {hostname}: {str(e)}"
-            self.logger.error(error_msg)
-            self.stats['failed'] += 1
-            return {'hostname': hostname, 'status': 'error', 'error': error_msg}
+        
+        # Save configuration; the header is its own gzip member so zcat still shows it
+        self.write_file(config_path, gzip.compress((
+            f"# Configuration backup for {hostname}\n"
+            f"# Backup date: {backup_date}\n"
+            f"# Device: {hostname}\n\n"
+        ).encode(), compresslevel=GZIP_COMPRESSLEVEL) + config_gzip)
+        
+        self.write_file(_sections_path(config_path), json.dumps(config_sections).encode())
+        self.write_file(device_dir / LATEST_HASH_FILE, f"{config_digest} {config_filename}\n".encode())
+        
+        # Save device info
+        self.write_file(info_path, (
+            f"# Device information for {hostname}\n"
+            f"# Backup date: {backup_date}\n\n"
+            f"{device_info_output}"
+        ).encode())
+        
+        # Create latest symlinks for easy access
+        self.update_latest_link(config_filename, latest_config)
+        self.update_latest_link(info_filename, latest_info)
+        
+        self.stats['successful'] += 1
+        self.logger.info(f"Successfully backed up {hostname}")
+        
+        return {
+            'hostname': hostname,
+            'status': 'success',
+            'config_file': str(config_path),
+            'info_file': str(info_path),
+            'timestamp': timestamp,
+            'config_size': config_sink.size
+        }
     
-    def backup_multiple_devices(self, devices, max_workers=5):
+    async def _backup_all_async(self, devices, max_workers):
+        """Run asyncssh backups on one event loop, at most max_workers at a time"""
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def bounded(device):
+            async with semaphore:
+                return await self.backup_device_config_async(device)
+        
+        return await asyncio.gather(*(bounded(device) for device in devices))
+    
+    def backup_multiple_devices(self, devices, max_workers=5, backend='netmiko'):
         """
         Backup multiple devices concurrently
         
         Args:
             devices (list): List of device dictionaries
             max_workers (int): Maximum concurrent connections
+            backend (str): 'netmiko' (worker threads) or 'asyncssh' (single event loop)
             
         Returns:
             list: List of backup results
@@ -185,16 +1221,61 @@ class CiscoBackupManager:
         self.logger.info(f"Starting backup for {len(devices)} devices")
         
         results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_device = {executor.submit(self.backup_device_config, device): device 
-                              for device in devices}
-            
-            for future in concurrent.futures.as_completed(future_to_device):
-                result = future.result()
-                results.append(result)
+        self._defer_writes = True
+        try:
+            if backend == 'asyncssh':
+                results = asyncio.run(self._backup_all_async(devices, max_workers))
+            else:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_to_device = {executor.submit(self.backup_device_config, device): device 
+                                      for device in devices}
+                    
+                    for future in concurrent.futures.as_completed(future_to_device):
+                        result = future.result()
+                        results.append(result)
+        finally:
+            self._defer_writes = False
+            failed_paths = self.flush_pending_writes()
+        
+        # Downgrade backups whose files or history entries never reached the disk
+        for result in results:
+            hostname = result['hostname']
+            if result['status'] == 'success' and (
+                    result['config_file'] in failed_paths or result['info_file'] in failed_paths):
+                result['status'] = 'error'
+                result['error'] = f"Failed to write backup files for {hostname}"
+                self.stats['successful'] -= 1
+                self.stats['failed'] += 1
+            elif result['status'] == 'unchanged' and (
+                    str(self.backup_dir / hostname / f"{hostname}_history.jsonl") in failed_paths):
+                result['status'] = 'error'
+                result['error'] = f"Failed to record unchanged backup for {hostname}"
+                self.stats['unchanged'] -= 1
+                self.stats['failed'] += 1
         
         return results
     
+    def close(self):
+        """Release pooled connections and flush queued log records"""
+        self.pool.close()
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def find_config_file(self, device_dir, hostname, timestamp):
+        """Locate a config backup, preferring .txt.gz over pre-compression .txt files"""
+        gz_path = device_dir / f"{hostname}_config_{timestamp}.txt.gz"
+        if gz_path.exists():
+            return gz_path
+        return device_dir / f"{hostname}_config_{timestamp}.txt"
+    
     def compare_configs(self, hostname, config1_timestamp, config2_timestamp):
         """
         Compare two configuration versions for a device
@@ -209,30 +1290,30 @@ class CiscoBackupManager:
         """
         device_dir = self.backup_dir / hostname
         
-        config1_path = device_dir / f"{hostname}_config_{config1_timestamp}.txt"
-        config2_path = device_dir / f"{hostname}_config_{config2_timestamp}.txt"
+        config1_path = self.find_config_file(device_dir, hostname, config1_timestamp)
+        config2_path = self.find_config_file(device_dir, hostname, config2_timestamp)
         
         if not config1_path.exists():
             return f"Error: Config file for {config1_timestamp} not found"
         if not config2_path.exists():
             return f"Error: Config file for {config2_timestamp} not found"
         
+        # Both timestamps resolve to the same backup file, so there is nothing to diff
+        stat1, stat2 = config1_path.stat(), config2_path.stat()
+        if (stat1.st_dev, stat1.st_ino) == (stat2.st_dev, stat2.st_ino):
+            return ''
+        
         try:
-            with open(config1_path, 'r') as f:
-                config1_lines = f.readlines()
-            with open(config2_path, 'r') as f:
-                config2_lines = f.readlines()
-            
-            diff = difflib.unified_diff(
-                config1_lines,
-                config2_lines,
-                fromfile=f"{hostname}_{config1_timestamp}",
-                tofile=f"{hostname}_{config2_timestamp}",
-                lineterm=''
+            return _cached_diff(
+                str(config1_path),
+                str(config2_path),
+                f"{hostname}_{config1_timestamp}",
+                f"{hostname}_{config2_timestamp}",
+                stat1.st_mtime_ns,
+                stat2.st_mtime_ns,
+                str(device_dir / '.diffs' / f"{config1_timestamp}_{config2_timestamp}.diff")
             )
             
-            return '\n'.join(diff)
-            
         except Exception as e:
             return f"Error comparing configs: {str(e)}"
     
@@ -244,8 +1325,9 @@ class CiscoBackupManager:
             'summary': {
                 'total_devices': self.stats['total_devices'],
                 'successful': self.stats['successful'],
+                'unchanged': self.stats['unchanged'],
                 'failed': self.stats['failed'],
-                'success_rate': f"{(self.stats['successful']/self.stats['total_devices']*100):.1f}%" 
+                'success_rate': f"{((self.stats['successful'] + self.stats['unchanged'])/self.stats['total_devices']*100):.1f}%" 
                              if self.stats['total_devices'] > 0 else "0%",
                 'duration': str(duration).split('.')[0]  # Remove microseconds
             },
@@ -267,11 +1349,81 @@ class CiscoBackupManager:
             return
         
         cutoff_date = datetime.now().timestamp() - (keep_days * 24 * 60 * 60)
+        prefix = f"{hostname}_config_"
+        
+        # Never remove whatever the latest link currently points at, even
+        # when its mtime is older than the cutoff, nor its section sidecar,
+        # which unchanged backups do not touch
+        latest_config = device_dir / f"{hostname}_latest_config.txt.gz"
+        if not latest_config.is_symlink():
+            # Not backed up since gzip backups were introduced, the plain-text link is still current
+            latest_config = device_dir / f"{hostname}_latest_config.txt"
+        try:
+            latest_inode = latest_config.stat().st_ino
+            latest_sections = _sections_path(latest_config.resolve()).name
+        except OSError:
+            latest_inode = latest_sections = None
         
-        for file_path in device_dir.glob(f"{hostname}_config_*.txt"):
-            if file_path.stat().st_mtime < cutoff_date:
-                file_path.unlink()
-                self.logger.info(f"Cleaned up old backup: {file_path}")
+        removed = 0
+        kept_timestamps = set()
+        with os.scandir(device_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(prefix) and entry.name.endswith(CONFIG_BACKUP_SUFFIXES)):
+                    continue
+                if (entry.inode() != latest_inode
+                        and entry.name != latest_sections
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff_date):
+                    os.unlink(entry.path)
+                    removed += 1
+                elif not entry.name.endswith('.sections.json'):
+                    kept_timestamps.add(entry.name[len(prefix):].split('.txt')[0])
+        
+        # Persisted diffs are only useful while both of their backups exist
+        try:
+            with os.scandir(device_dir / '.diffs') as entries:
+                for entry in entries:
+                    # Named {ts1}_{ts2}.diff, and timestamps contain underscores themselves
+                    name = entry.name[:-len('.diff')]
+                    if not any(name[:i] in kept_timestamps and name[i + 1:] in kept_timestamps
+                               for i, char in enumerate(name) if char == '_'):
+                        os.unlink(entry.path)
+                        removed += 1
+        except FileNotFoundError:
+            pass
+        
+        # Unchanged runs append to the history file, so trim it to the same window
+        history_path = device_dir / f"{hostname}_history.jsonl"
+        try:
+            with open(history_path) as f:
+                history = f.readlines()
+        except FileNotFoundError:
+            history = []
+        recent = [line for line in history if not self._history_expired(line, cutoff_date)]
+        if len(recent) < len(history):
+            tmp_path = history_path.with_suffix('.tmp')
+            tmp_path.write_text(''.join(recent))
+            os.replace(tmp_path, history_path)
+        
+        self.logger.info(f"Cleaned up {removed} old backup files and {len(history) - len(recent)} "
+                         f"history entries for {hostname}")
+    
+    @staticmethod
+    def _history_expired(line, cutoff_date):
+        """Whether a history line is older than cutoff_date, keeping lines that cannot be parsed"""
+        try:
+            return datetime.fromisoformat(json.loads(line)['ts']).timestamp() < cutoff_date
+        except (ValueError, KeyError, TypeError):
+            return False
+
+
+def _positive_float(value):
+    """argparse type for rates that must be greater than zero"""
+    import argparse
+    
+    rate = float(value)
+    if rate <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return rate
 
 
 def main():
@@ -284,65 +1436,91 @@ def main():
     parser.add_argument('--compare', nargs=3, help='Compare configs: hostname timestamp1 timestamp2')
     parser.add_argument('--cleanup', nargs=2, help='Cleanup old backups: hostname days_to_keep')
     parser.add_argument('--workers', type=int, default=5, help='Max concurrent connections')
+    parser.add_argument('--durable', action='store_true', help='fsync every backup file to disk')
+    parser.add_argument('--connect-rate', type=_positive_float, help='Max new SSH connections per second')
+    parser.add_argument('--backend', choices=['netmiko', 'asyncssh'], default='netmiko',
+                        help='SSH backend: netmiko threads or a single asyncssh event loop')
+    parser.add_argument('--json', action='store_true', help='Print results and report as JSON')
     
     args = parser.parse_args()
     
-    backup_manager = CiscoBackupManager()
-    
-    if args.compare:
-        hostname, ts1, ts2 = args.compare
-        diff_output = backup_manager.compare_configs(hostname, ts1, ts2)
-        print(diff_output)
-        return
-    
-    if args.cleanup:
-        hostname, days = args.cleanup
-        backup_manager.cleanup_old_backups(hostname, int(days))
+    if args.backend == 'asyncssh' and asyncssh is None:
+        print("Error: asyncssh library required for --backend asyncssh. Install with: pip install asyncssh")
         return
     
-    # Get devices from config
-    try:
-        if args.device:
-            # Backup single device
-            devices = [d for d in config.DEVICES if d.get('hostname', d['host']) == args.device]
-            if not devices:
-                print(f"Device {args.device} not found in config")
-                return
-        elif args.all:
-            # Backup all devices
-            devices = config.DEVICES
-        else:
-            print("Please specify --device <hostname> or --all")
+    # JSON output must be the only thing on stdout
+    with CiscoBackupManager(
+        durable=args.durable,
+        max_workers=args.workers,
+        connect_rate=args.connect_rate,
+        log_stream=sys.stderr if args.json else sys.stdout
+    ) as backup_manager:
+        if args.compare:
+            hostname, ts1, ts2 = args.compare
+            diff_output = backup_manager.compare_configs(hostname, ts1, ts2)
+            print(diff_output)
             return
+        
+        if args.cleanup:
+            hostname, days = args.cleanup
+            backup_manager.cleanup_old_backups(hostname, int(days))
+            return
+        
+        # Get devices from config
+        try:
+            if args.device:
+                # Backup single device
+                devices = [d for d in config.DEVICES if d.get('hostname', d['host']) == args.device]
+                if not devices:
+                    print(f"Device {args.device} not found in config")
+                    return
+            elif args.all:
+                # Backup all devices
+                devices = config.DEVICES
+            else:
+                print("Please specify --device <hostname> or --all")
+                return
             
-    except AttributeError:
-        print("Error: DEVICES list not found in config.py")
-        return
-    
-    # Perform backups
-    results = backup_manager.backup_multiple_devices(devices, args.workers)
+        except AttributeError:
+            print("Error: DEVICES list not found in config.py")
+            return
+        
+        # Perform backups
+        results = backup_manager.backup_multiple_devices(devices, args.workers, args.backend)
+        
+        report = backup_manager.get_backup_report()
     
-    # Display results
-    print("\n" + "="*60)
-    print("BACKUP OPERATION SUMMARY")
-    print("="*60)
+    # Leaving the block stopped the log listener, so no queued record can interleave below
+    if args.json:
+        output = {'results': results, 'report': report}
+        sys.stdout.write((orjson.dumps(output).decode() if orjson else json.dumps(output)) + "\n")
+        return
     
+    # Display results, built up front and written in one go
+    lines = ["", "="*60, "BACKUP OPERATION SUMMARY", "="*60]
     for result in results:
-        status_symbol = "✅" if result['status'] == 'success' else "❌"
-        print(f"{status_symbol} {result['hostname']}: {result['status']}")
-        
-        if result['status'] == 'success':
-            print(f"   📁 Config: {result['config_file']}")
-            print(f"   📊 Size: {result['config_size']} bytes")
+        if result['status'] in ('success', 'unchanged'):
+            lines.append(
+                f"✅ {result['hostname']}: {result['status']}\n"
+                f"   📁 Config: {result['config_file']}\n"
+                f"   📊 Size: {result['config_size']} bytes"
+            )
         else:
-            print(f"   ⚠️  Error: {result.get('error', 'Unknown error')}")
+            lines.append(
+                f"❌ {result['hostname']}: {result['status']}\n"
+                f"   ⚠️  Error: {result.get('error', 'Unknown error')}"
+            )
     
     # Final report
-    report = backup_manager.get_backup_report()
-    print(f"\n📈 Success Rate: {report['summary']['success_rate']}")
-    print(f"⏱️  Duration: {report['summary']['duration']}")
-    print(f"📅 Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
+    summary = report['summary']
+    lines.append(
+        f"\n📈 Success Rate: {summary['success_rate']}\n"
+        f"♻️  Unchanged: {summary['unchanged']}\n"
+        f"⏱️  Duration: {summary['duration']}\n"
+        f"📅 Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+        
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,12 @@ import json
 import sys
 from urllib3.exceptions import InsecureRequestWarning
 
+# Opcional: parser JSON en Rust, mucho más rápido con árboles RESTCONF grandes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Suprimir warnings de SSL para DevNet Sandbox
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -19,9 +25,32 @@ PORT = "8181"
 USERNAME = "developer"
 PASSWORD = "C1sco12345"
 
-def test_connection():
+def create_session():
+    """
+    Crea una sesión HTTP reutilizable para las llamadas RESTCONF
+    
+    La sesión mantiene viva la conexión TLS, así cada llamada adicional
+    al dispositivo evita un nuevo handshake.
+    """
+    session = requests.Session()
+    
+    # Autenticación
+    session.auth = (USERNAME, PASSWORD)
+    session.verify = False  # Para DevNet Sandbox
+    
+    # Headers básicos
+    session.headers.update({
+        'Accept': 'application/yang-data+json',
+        'Content-Type': 'application/yang-data+json'
+    })
+    return session
+
+def test_connection(session=None):
     """
     Prueba la conexión básica al dispositivo
+    
+    Args:
+        session (requests.Session): Sesión a reutilizar; se crea una si no se indica
     """
     print("🔍 Cisco Device Discovery Tool")
     print("=" * 40)
@@ -29,14 +58,8 @@ def test_connection():
     # URL base para API REST
     base_url = f"https://{DEVICE_IP}:{PORT}/restconf/data"
     
-    # Headers básicos
-    headers = {
-        'Accept': 'application/yang-data+json',
-        'Content-Type': 'application/yang-data+json'
-    }
-    
-    # Autenticación
-    auth = (USERNAME, PASSWORD)
+    if session is None:
+        session = create_session()
     
     try:
         print(f"📡 Conectando a {DEVICE_IP}:{PORT}...")
@@ -44,13 +67,7 @@ def test_connection():
         # Endpoint simple para probar conectividad
         url = f"{base_url}/ietf-interfaces:interfaces"
         
-        response = requests.get(
-            url,
-            headers=headers,
-            auth=auth,
-            verify=False,  # Para DevNet Sandbox
-            timeout=10
-        )
+        response = session.get(url, timeout=10)
         
         if response.status_code == 200:
             print("✅ Conexión exitosa!")
@@ -59,7 +76,8 @@ def test_connection():
             
             # Mostrar info básica si está disponible
             try:
-                data = response.json()
+                # orjson.JSONDecodeError hereda de json.JSONDecodeError
+                data = orjson.loads(response.content) if orjson else response.json()
                 if 'ietf-interfaces:interfaces' in data:
                     interfaces = data['ietf-interfaces:interfaces'].get('interface', [])
                     print(f"✅ Interfaces encontradas: {len(interfaces)}")
@@ -104,7 +122,10 @@ def show_device_info():
 if __name__ == "__main__":
     print("🚀 Iniciando Cisco Device Discovery...")
     show_device_info()
-    test_connection()
+    
+    # Una sola sesión para todas las llamadas RESTCONF
+    with create_session() as session:
+        test_connection(session)
     
     # Exit code para indicar éxito/fallo
     print("\n✨ Script ejecutado correctamente")
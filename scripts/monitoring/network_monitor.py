@@ -14,24 +14,59 @@ Features:
 """
 
 import os
+import re
 import sys
 import json
+import shutil
+import socket
+import struct
 import time
+import atexit
+import asyncio
 import logging
-import threading
+import functools
 import subprocess
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import statistics
 
 try:
-    from pysnmp.hlapi import *
+    from pysnmp.hlapi.asyncio import *
+    # Renamed to get_cmd/bulk_cmd in pysnmp 7
+    from pysnmp.hlapi.asyncio import getCmd, bulkCmd
     import requests
+    import numpy as np
 except ImportError:
     print("Error: Required libraries missing. Install with:")
-    print("pip install pysnmp requests")
+    print("pip install 'pysnmp>=6.0,<7' requests numpy")
     sys.exit(1)
+except AttributeError:
+    # pysnmp before 6 still uses asyncio.coroutine, removed in Python 3.11
+    print("Error: Unsupported pysnmp version. Install with:")
+    print("pip install 'pysnmp>=6.0,<7'")
+    sys.exit(1)
+
+# Optional: faster report serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: asyncio-native SNMP client with a compiled ASN.1 codec, used instead of pysnmp
+try:
+    import aiosnmp
+except ImportError:
+    aiosnmp = None
+
+# Optional: libuv based event loop with cheaper socket and subprocess I/O
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add parent directory to path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -42,21 +77,367 @@ except ImportError:
     print("Error: config.py not found. Please ensure config.py exists in project root.")
     sys.exit(1)
 
+# Scalar OIDs fetched in every monitoring cycle; the OID maps are read-only
+SYSTEM_OIDS = MappingProxyType({
+    'sysUpTime': '1.3.6.1.2.1.1.3.0',
+    'sysDescr': '1.3.6.1.2.1.1.1.0',
+    'sysName': '1.3.6.1.2.1.1.5.0'
+})
+
+# Cisco specific CPU and memory OIDs
+PERFORMANCE_OIDS = MappingProxyType({
+    'cpu_5min': '1.3.6.1.4.1.9.9.109.1.1.1.1.8.1',  # Cisco CPU 5min avg
+    'memory_used': '1.3.6.1.4.1.9.9.48.1.1.1.5.1',   # Cisco memory used
+    'memory_free': '1.3.6.1.4.1.9.9.48.1.1.1.6.1'    # Cisco memory free
+})
+
+# ifTable columns, walked together until each leaves its subtree
+INTERFACE_OIDS = MappingProxyType({
+    'name': '1.3.6.1.2.1.2.2.1.2',    # ifDescr
+    'speed': '1.3.6.1.2.1.2.2.1.5',   # ifSpeed
+    'status': '1.3.6.1.2.1.2.2.1.8'   # ifOperStatus
+})
+
+# Request OIDs of a device poll, built once instead of per device
+BULK_SCALAR_OIDS = tuple(SYSTEM_OIDS.values()) + tuple(PERFORMANCE_OIDS.values())
+BULK_COLUMN_OIDS = tuple(INTERFACE_OIDS.values())
+
+# SNMP request timeout in seconds and retries per request
+SNMP_TIMEOUT = 2
+SNMP_RETRIES = 1
+
+# ifTable rows requested per GetBulkRequest while walking interfaces
+INTERFACE_BULK_REPETITIONS = 10
+
+# System ping summary, e.g. '4 packets transmitted, 4 received, 0% packet loss'
+# and 'rtt min/avg/max/mdev = 0.9/1.2/1.8/0.3 ms' (stddev on BSD/macOS)
+_PING_LOSS_RE = re.compile(r'(\d+(?:\.\d+)?)% packet loss')
+_PING_RTT_RE = re.compile(r'min/avg/max(?:/\w+)?\s*=\s*[\d.]+/([\d.]+)/')
+
+# fping -q summary line, e.g. '10.0.0.1 : xmt/rcv/%loss = 4/4/0%, min/avg/max = 0.9/1.2/1.8'
+_FPING_RE = re.compile(
+    rb'^(\S+)\s*: xmt/rcv/%loss = \d+/(\d+)/(\d+)%(?:, min/avg/max = [\d.]+/([\d.]+)/[\d.]+)?', re.M
+)
+_FPING = shutil.which('fping')
+
+# Echo requests per ping and the spacing between them, in seconds
+PING_COUNT = 4
+PING_INTERVAL = 0.2
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+
+# Samples of history kept per device
+HISTORY_SIZE = 100
+
+# Alerts kept for reports, a power of two so slots are found with a mask
+ALERT_HISTORY_SIZE = 1024
+
+# Devices polled at the same time on the event loop
+MAX_CONCURRENT_DEVICES = 256
+
+# Seconds a single device may take before its cycle is abandoned
+DEVICE_TIMEOUT = 30
+
+# Write buffer for reports encoded chunk by chunk
+REPORT_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _getnext_anchor(oid):
+    """OID whose GETNEXT successor is exactly the given instance, if it exists"""
+    parent, _, last = oid.rpartition('.')
+    return parent if last == '0' else f"{parent}.{int(last) - 1}"
+
+
+def _as_float(value):
+    """Metric value as a float for threshold arrays, NaN if missing or not numeric"""
+    return value if isinstance(value, (int, float)) else np.nan
+
+
+def _build_object_types(oids):
+    """pysnmp ObjectTypes for dotted OIDs"""
+    return tuple(ObjectType(ObjectIdentity(tuple(int(arc) for arc in oid.split('.')))) for oid in oids)
+
+
+@functools.lru_cache(maxsize=256)
+def _object_types(oids):
+    """
+    pysnmp ObjectTypes for a tuple of dotted OIDs, memoized
+    
+    pysnmp resolves an ObjectType against the MIB only once, so reusing
+    them skips both the OID parsing and the MIB lookup on later requests.
+    Only for fixed OID sets; one-off requests use _build_object_types().
+    """
+    return _build_object_types(oids)
+
+
+def _snmp_value(value):
+    """SNMP value as the string pysnmp would render, None if absent"""
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return str(value)
+
+
+def _ping_result(status, packet_loss, avg_latency, timestamp, error=None):
+    """Build a ping result dict, the format shared by every ping implementation"""
+    result = {
+        'status': status,
+        'packet_loss': packet_loss,
+        'avg_latency': avg_latency,
+        'timestamp': timestamp
+    }
+    if error is not None:
+        result['error'] = error
+    return result
+
+
+def _icmp_checksum(data):
+    """RFC 1071 internet checksum"""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class IcmpPinger:
+    """
+    ICMP echo over one unprivileged datagram socket shared by all pings
+    
+    Linux allows SOCK_DGRAM ICMP sockets for groups listed in
+    net.ipv4.ping_group_range; the kernel handles the echo identifier,
+    so replies are matched to their requests by sequence number alone.
+    """
+    
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        self.sock.setblocking(False)
+        self._loop = None
+        self._sequence = 0
+        self._pending = {}  # sequence -> (reply future, destination address, send time in ns)
+    
+    def _ensure_reader(self):
+        """Register the socket with the running event loop, once per loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            loop.add_reader(self.sock.fileno(), self._on_readable)
+            self._loop = loop
+    
+    def _on_readable(self):
+        """Drain every queued reply and resolve the matching probes"""
+        received = time.perf_counter_ns()
+        while True:
+            try:
+                packet, (address, _) = self.sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                continue
+            
+            # Some platforms hand over the IP header as well
+            if packet[0] >> 4 == 4:
+                packet = packet[(packet[0] & 0x0F) * 4:]
+            if len(packet) < 8 or packet[0] != ICMP_ECHO_REPLY:
+                continue
+            
+            sequence = struct.unpack('!H', packet[6:8])[0]
+            pending = self._pending.get(sequence)
+            if pending and pending[1] == address and not pending[0].done():
+                pending[0].set_result(received - pending[2])
+    
+    async def _probe(self, address, delay, timeout, first_reply=None):
+        """Send one echo request after delay seconds, returning its RTT in ns or None"""
+        await asyncio.sleep(delay)
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        sequence = self._sequence
+        
+        header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, 0, sequence)
+        payload = b'\x00' * 56
+        checksum = _icmp_checksum(header + payload)
+        packet = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, 0, sequence) + payload
+        
+        future = self._loop.create_future()
+        self._pending[sequence] = (future, address, time.perf_counter_ns())
+        try:
+            self.sock.sendto(packet, (address, 0))
+            rtt = await asyncio.wait_for(future, timeout)
+            if first_reply is not None:
+                first_reply.set()
+            return rtt
+        except (asyncio.TimeoutError, OSError):
+            return None
+        finally:
+            self._pending.pop(sequence, None)
+    
+    async def ping(self, hostname, count=PING_COUNT, timeout=5, timestamp=None, first_reply=None):
+        """
+        Ping a device
+        
+        Args:
+            hostname (str): Device hostname or IP
+            count (int): Echo requests to send
+            timeout (int): Seconds to wait for each reply
+            timestamp (str): Timestamp for the result, now if None
+            first_reply (asyncio.Event): Set as soon as any echo reply arrives
+            
+        Returns:
+            dict: Ping results with latency and packet loss, as NetworkMonitor.system_ping()
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        self._ensure_reader()
+        try:
+            address = (await self._loop.getaddrinfo(hostname, None, family=socket.AF_INET))[0][4][0]
+        except OSError as e:
+            return _ping_result('error', 100, 0, timestamp, str(e))
+        
+        rtts = await asyncio.gather(*(self._probe(address, i * PING_INTERVAL, timeout, first_reply) for i in range(count)))
+        replies = [rtt / 1e6 for rtt in rtts if rtt is not None]
+        
+        if not replies:
+            return _ping_result('down', 100, 0, timestamp, f"No ICMP echo replies from {hostname}")
+        return _ping_result('up', (count - len(replies)) / count * 100, statistics.mean(replies), timestamp)
+    
+    def close(self):
+        """Unregister and close the socket"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self.sock.fileno())
+        self.sock.close()
+
+
+class DeviceRing:
+    """
+    Fixed-size history of a device's trend scalars, one NumPy array per metric
+    
+    Only CPU, memory, latency and the sample time are kept; the full
+    metrics dict of the latest sample lives in NetworkMonitor.devices_status.
+    Missing or non-numeric values are stored as NaN.
+    """
+    
+    def __init__(self, size=HISTORY_SIZE):
+        self.size = size
+        self.cpu = np.full(size, np.nan, dtype=np.float32)
+        self.mem = np.full(size, np.nan, dtype=np.float32)
+        self.lat = np.full(size, np.nan, dtype=np.float32)
+        self.ts = np.full(size, np.nan, dtype=np.float64)  # float32 would round epoch seconds to minutes
+        self.idx = 0  # total samples appended; idx % size is the next slot
+    
+    def __len__(self):
+        return min(self.idx, self.size)
+    
+    def append(self, metrics):
+        """Store the trend scalars of one metrics dict, overwriting the oldest sample"""
+        slot = self.idx % self.size
+        performance = metrics.get('performance', {})
+        # Values that failed float() are kept as raw strings in the metrics dict
+        self.cpu[slot] = _as_float(performance.get('cpu_5min'))
+        self.mem[slot] = _as_float(performance.get('memory_percent'))
+        self.lat[slot] = _as_float(metrics.get('connectivity', {}).get('avg_latency'))
+        self.ts[slot] = datetime.fromisoformat(metrics['timestamp']).timestamp()
+        self.idx += 1
+
+
+class AlertRing:
+    """
+    Preallocated ring of the most recent alerts
+    
+    Appends overwrite the oldest slot in place and the number of critical
+    alerts held is kept up to date, so reports never copy the whole ring.
+    """
+    
+    def __init__(self, size=ALERT_HISTORY_SIZE):
+        if size & (size - 1):
+            raise ValueError(f"Alert ring size must be a power of two, got {size}")
+        self.mask = size - 1
+        self.slots = [None] * size
+        self.idx = 0  # total alerts appended; idx & mask is the next slot
+        self.critical = 0
+    
+    def __len__(self):
+        return min(self.idx, len(self.slots))
+    
+    def __iter__(self):
+        """Alerts held, oldest first"""
+        return iter(self.recent(len(self)))
+    
+    def append(self, alert):
+        """Store an alert, overwriting the oldest one when full"""
+        slot = self.idx & self.mask
+        oldest = self.slots[slot]
+        if oldest is not None and oldest['severity'] == 'critical':
+            self.critical -= 1
+        if alert['severity'] == 'critical':
+            self.critical += 1
+        self.slots[slot] = alert
+        self.idx += 1
+    
+    def recent(self, count):
+        """
+        Latest alerts, oldest first
+        
+        Args:
+            count (int): Alerts to return at most
+            
+        Returns:
+            list: Up to count alerts in append order
+        """
+        count = min(count, len(self))
+        return [self.slots[(self.idx - i) & self.mask] for i in range(count, 0, -1)]
+
 
 class NetworkMonitor:
     """
     Comprehensive network monitoring system for Cisco devices
     """
     
-    def __init__(self, monitoring_interval=60):
+    def __init__(self, monitoring_interval=60, use_system_ping=False, processes=1):
         self.monitoring_interval = monitoring_interval
+        self.use_system_ping = use_system_ping
+        
+        # Worker processes sharing the fleet, each with its own event loop; created on first use
+        self.processes = processes
+        self._process_pool = None
+        
+        # Threads for blocking system pings, reused across cycles and event loops
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=min(64, (os.cpu_count() or 4) * 8),
+            thread_name_prefix='netmon'
+        )
         self.devices_status = {}
-        self.metrics_history = defaultdict(lambda: deque(maxlen=100))
-        self.alerts_queue = deque(maxlen=1000)
+        self.metrics_history = defaultdict(DeviceRing)
+        self.alerts_queue = AlertRing()
         self.monitoring_active = False
+        
+        # (hostname, interface name) -> whether interface alerts apply to it
+        self._ethernet_cache = {}
+        
+        # One engine, and so one UDP socket, shared by every SNMP request;
+        # per-device targets and credentials are built once and reused
+        self.snmp_engine = SnmpEngine()
+        self._snmp_context = ContextData()
+        self._transport_cache = {}
+        self._community_cache = {}
+        self._snmp_loop = None  # the engine's dispatcher is bound to this event loop
+        
+        # aiosnmp sessions, one socket per device, bound to the loop they were opened on
+        self._aiosnmp_sessions = {}
+        self._aiosnmp_loop = None
         self.setup_logging()
         self.setup_directories()
         
+        # In-process ICMP unless disabled or not permitted by the kernel
+        self.pinger = None
+        if not use_system_ping:
+            try:
+                self.pinger = IcmpPinger()
+            except OSError as e:
+                self.logger.warning(f"ICMP sockets unavailable, using system ping: {str(e)}")
+        
+        atexit.register(self.close)
+        
         # Default thresholds
         self.thresholds = {
             'ping_timeout': 5.0,
@@ -97,73 +478,193 @@ class NetworkMonitor:
         for dir_path in directories:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
     
-    def ping_device(self, hostname, timeout=5):
+    async def ping_device(self, hostname, timeout=5, timestamp=None, count=PING_COUNT, first_reply=None):
         """
         Ping device to check basic connectivity
         
         Args:
             hostname (str): Device hostname or IP
             timeout (int): Ping timeout in seconds
+            timestamp (str): Timestamp for the result, now if None
+            count (int): Echo requests to send
+            first_reply (asyncio.Event): Set once a reply is known to have
+                arrived; the system ping only reports that when it finishes
+            
+        Returns:
+            dict: Ping results with latency and packet loss
+        """
+        if self.pinger is not None:
+            return await self.pinger.ping(
+                hostname, count=count, timeout=timeout, timestamp=timestamp, first_reply=first_reply
+            )
+        
+        # The system ping blocks, so it runs off the event loop
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._thread_pool, self.system_ping, hostname, timeout, timestamp, count
+        )
+        if first_reply is not None and result['status'] == 'up':
+            first_reply.set()
+        return result
+    
+    def system_ping(self, hostname, timeout=5, timestamp=None, count=PING_COUNT):
+        """
+        Ping device with the system ping command
+        
+        Args:
+            hostname (str): Device hostname or IP
+            timeout (int): Ping timeout in seconds
+            timestamp (str): Timestamp for the result, now if None
+            count (int): Echo requests to send
             
         Returns:
             dict: Ping results with latency and packet loss
         """
+        timestamp = timestamp or datetime.now().isoformat()
         try:
             # Use system ping command
-            cmd = ['ping', '-c', '4', '-W', str(timeout * 1000), hostname]
+            cmd = ['ping', '-c', str(count), '-W', str(timeout * 1000), hostname]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout + 5)
             
             if result.returncode == 0:
                 # Parse ping output for statistics
-                lines = result.stdout.strip().split('\n')
-                stats_line = [line for line in lines if 'packet loss' in line]
-                time_line = [line for line in lines if 'min/avg/max' in line]
-                
-                packet_loss = 0
-                avg_latency = 0
-                
-                if stats_line:
-                    # Extract packet loss percentage
-                    packet_loss = float(stats_line[0].split('%')[0].split()[-1])
+                loss_match = _PING_LOSS_RE.search(result.stdout)
+                rtt_match = _PING_RTT_RE.search(result.stdout)
                 
-                if time_line:
-                    # Extract average latency
-                    times = time_line[0].split('=')[1].strip().split('/')
-                    avg_latency = float(times[1])  # avg time
+                packet_loss = float(loss_match.group(1)) if loss_match else 0
+                avg_latency = float(rtt_match.group(1)) if rtt_match else 0
                 
-                return {
-                    'status': 'up',
-                    'packet_loss': packet_loss,
-                    'avg_latency': avg_latency,
-                    'timestamp': datetime.now().isoformat()
-                }
+                return _ping_result('up', packet_loss, avg_latency, timestamp)
             else:
-                return {
-                    'status': 'down',
-                    'packet_loss': 100,
-                    'avg_latency': 0,
-                    'error': result.stderr.strip(),
-                    'timestamp': datetime.now().isoformat()
-                }
+                return _ping_result('down', 100, 0, timestamp, result.stderr.strip())
                 
         except subprocess.TimeoutExpired:
-            return {
-                'status': 'timeout',
-                'packet_loss': 100,
-                'avg_latency': 0,
-                'error': 'Ping timeout exceeded',
-                'timestamp': datetime.now().isoformat()
-            }
+            return _ping_result('timeout', 100, 0, timestamp, 'Ping timeout exceeded')
         except Exception as e:
-            return {
-                'status': 'error',
-                'packet_loss': 100,
-                'avg_latency': 0,
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+            return _ping_result('error', 100, 0, timestamp, str(e))
+    
+    async def ping_batch(self, hosts, timeout=5, timestamp=None):
+        """
+        Ping many devices at once with a single fping process
+        
+        Args:
+            hosts (list): Device hostnames or IPs
+            timeout (int): Per-probe timeout in seconds
+            timestamp (str): Timestamp for the results, now if None
+            
+        Returns:
+            dict: Ping results per host, in ping_device() format; empty if
+            fping is not installed or did not finish
+        """
+        if not _FPING or not hosts:
+            return {}
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                _FPING, '-c', '4', '-q', '-t', str(timeout * 1000), *dict.fromkeys(hosts),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            # fping always ends after its probe count; it exits non-zero when
+            # any host is unreachable, but the summary is still complete
+            _, stderr = await process.communicate()
+        except OSError as e:
+            self.logger.warning(f"fping failed, falling back to ping: {str(e)}")
+            return {}
+        
+        timestamp = timestamp or datetime.now().isoformat()
+        results = {}
+        for match in _FPING_RE.finditer(stderr):
+            host, received, loss, avg = match.groups()
+            if int(received):
+                results[host.decode()] = _ping_result('up', float(loss), float(avg) if avg else 0, timestamp)
+            else:
+                results[host.decode()] = _ping_result('down', 100, 0, timestamp, match.group(0).decode())
+        return results
     
-    def get_snmp_metric(self, hostname, community, oid):
+    def _snmp_target(self, hostname, community):
+        """
+        Cached SNMP credentials and transport for a device
+        
+        UdpTransportTarget resolves the hostname when it is built, so
+        caching it also saves a DNS lookup per request. The engine and
+        transports are rebuilt when called from a different event loop.
+        
+        Returns:
+            tuple: (CommunityData, UdpTransportTarget)
+        """
+        loop = asyncio.get_running_loop()
+        if self._snmp_loop is not loop:
+            if self._snmp_loop is not None:
+                # The dispatcher and transports belong to the previous loop
+                self._close_snmp_engine()
+                self.snmp_engine = SnmpEngine()
+            self._snmp_loop = loop
+        
+        community_data = self._community_cache.get(community)
+        if community_data is None:
+            community_data = self._community_cache[community] = CommunityData(community)
+        
+        transport = self._transport_cache.get(hostname)
+        if transport is None:
+            transport = self._transport_cache[hostname] = UdpTransportTarget(
+                (hostname, 161), timeout=SNMP_TIMEOUT, retries=SNMP_RETRIES
+            )
+        return community_data, transport
+    
+    async def _aiosnmp_session(self, hostname, community):
+        """
+        Cached, connected aiosnmp session for a device
+        
+        The session is opened by a task shared between callers, so devices
+        polled at the same time never open duplicate sockets.
+        
+        Returns:
+            aiosnmp.Snmp: Session for the device
+        """
+        loop = asyncio.get_running_loop()
+        if self._aiosnmp_loop is not loop:
+            self._close_aiosnmp()
+            self._aiosnmp_loop = loop
+        
+        key = (hostname, community)
+        session = self._aiosnmp_sessions.get(key)
+        if session is None:
+            session = self._aiosnmp_sessions[key] = loop.create_task(
+                aiosnmp.Snmp(
+                    host=hostname,
+                    community=community,
+                    timeout=SNMP_TIMEOUT,
+                    retries=SNMP_RETRIES + 1
+                ).__aenter__()
+            )
+        try:
+            return await asyncio.shield(session)
+        except Exception:
+            # Resolution or socket failure; retry on the next request
+            self._aiosnmp_sessions.pop(key, None)
+            raise
+    
+    def _close_snmp_engine(self):
+        """Close the pysnmp dispatcher and forget the transports built for it"""
+        if self.snmp_engine.transportDispatcher is not None:
+            try:
+                self.snmp_engine.transportDispatcher.closeDispatcher()
+            except Exception as e:
+                self.logger.debug(f"Error closing SNMP dispatcher: {str(e)}")
+        self._transport_cache.clear()
+    
+    def _close_aiosnmp(self):
+        """Close every aiosnmp session"""
+        for session in self._aiosnmp_sessions.values():
+            if session.done() and not session.cancelled() and session.exception() is None:
+                try:
+                    session.result().close()
+                except RuntimeError:
+                    # Its event loop is already closed
+                    pass
+        self._aiosnmp_sessions.clear()
+    
+    async def get_snmp_metric(self, hostname, community, oid):
         """
         Get SNMP metric from device
         
@@ -176,36 +677,158 @@ class NetworkMonitor:
             str: SNMP response value or None if failed
         """
         try:
-            for (errorIndication, errorStatus, errorIndex, varBinds) in nextCmd(
-                SnmpEngine(),
-                CommunityData(community),
-                UdpTransportTarget((hostname, 161)),
-                ContextData(),
-                ObjectType(ObjectIdentity(oid)),
-                lexicographicMode=False,
-                ignoreNonIncreasingOid=True,
-                maxRows=1):
-
-                if errorIndication:
-                    self.logger.debug(f"SNMP error indication: {errorIndication}")
-                    break
-                elif errorStatus:
-                    self.logger.debug(f"SNMP error status: {errorStatus.prettyPrint()}")
-                    break
-                else:
-                    for varBind in varBinds:
-                        return str(varBind[1])
+            if aiosnmp:
+                session = await self._aiosnmp_session(hostname, community)
+                for varBind in await session.get(oid):
+                    return _snmp_value(varBind.value)
+                return None
+            
+            community_data, transport = self._snmp_target(hostname, community)
+            errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+                self.snmp_engine,
+                community_data,
+                transport,
+                self._snmp_context,
+                *_object_types((oid,)),
+                lookupMib=False
+            )
+            
+            if errorIndication:
+                self.logger.debug(f"SNMP error indication: {errorIndication}")
+            elif errorStatus:
+                self.logger.debug(f"SNMP error status: {errorStatus.prettyPrint()}")
+            else:
+                for varBind in varBinds:
+                    return str(varBind[1])
             return None
         except Exception as e:
             self.logger.debug(f"SNMP query failed for {hostname}: {str(e)}")
             return None
     
-    def collect_device_metrics(self, device_info):
+    async def get_snmp_bulk(self, hostname, community, scalar_oids, column_oids, max_repetitions):
+        """
+        Get scalar values and walk table columns from a device with GetBulkRequests
+        
+        Scalars are sent as non-repeaters anchored just before each
+        instance, so every one resolves in the same PDU as the first rows
+        of the table columns. Further requests continue the columns until
+        each leaves its subtree, so a table that fits max_repetitions rows
+        takes a single round trip.
+        
+        Args:
+            hostname (str): Device hostname or IP
+            community (str): SNMP community string
+            scalar_oids (list): Instance OIDs to fetch once
+            column_oids (list): Table column OIDs to walk
+            max_repetitions (int): Rows to fetch per column and request
+            
+        Returns:
+            tuple: (dict of scalar OID -> value, dict of column OID -> {index: value})
+        """
+        scalars = {}
+        columns = {column: {} for column in column_oids}
+        
+        # Last OID returned for every column that is still inside its subtree
+        cursors = {column: column for column in column_oids}
+        non_repeaters = list(scalar_oids)
+        
+        try:
+            while non_repeaters or cursors:
+                walking = list(cursors)
+                rows = await self._snmp_bulk_rows(
+                    hostname,
+                    community,
+                    len(non_repeaters),
+                    max_repetitions,
+                    [_getnext_anchor(oid) for oid in non_repeaters] + [cursors[column] for column in walking],
+                    # Only the first request is the same every cycle, later ones carry per-device cursors
+                    memoize=bool(non_repeaters)
+                )
+                
+                for row in rows:
+                    # Every row repeats the non-repeaters, followed by one entry per column
+                    for oid, (name, value) in zip(non_repeaters, row):
+                        if name == oid and value is not None:
+                            scalars[oid] = value
+                    
+                    for column, (name, value) in zip(walking, row[len(non_repeaters):]):
+                        if column not in cursors:
+                            continue
+                        if name.startswith(column + '.') and name != cursors[column]:
+                            columns[column][name[len(column) + 1:]] = value
+                            cursors[column] = name
+                        else:
+                            # Past the last row or at the end of the MIB view
+                            del cursors[column]
+                
+                # Scalars only go in the first request
+                non_repeaters = []
+                if not rows:
+                    break
+        except Exception as e:
+            self.logger.debug(f"SNMP bulk query failed for {hostname}: {str(e)}")
+        
+        return scalars, columns
+    
+    async def _snmp_bulk_rows(self, hostname, community, non_repeaters, max_repetitions, oids, memoize=False):
+        """
+        Send one GetBulkRequest with whichever SNMP client is installed
+        
+        Args:
+            hostname (str): Device hostname or IP
+            community (str): SNMP community string
+            non_repeaters (int): Leading OIDs to fetch once
+            max_repetitions (int): Rows to fetch for the remaining OIDs
+            oids (list): Request OIDs
+            memoize (bool): Reuse cached pysnmp ObjectTypes for this exact OID list
+            
+        Returns:
+            list: Rows of (OID, value) string pairs, empty if the agent reported an error
+        """
+        if aiosnmp:
+            session = await self._aiosnmp_session(hostname, community)
+            varBinds = [
+                (varBind.oid.lstrip('.'), _snmp_value(varBind.value))
+                for varBind in await session.get_bulk(
+                    oids, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+                )
+            ]
+            
+            # aiosnmp returns the varbinds flat, split them into pysnmp style rows
+            head, tail = varBinds[:non_repeaters], varBinds[non_repeaters:]
+            width = len(oids) - non_repeaters
+            if not width:
+                return [head]
+            return [head + tail[i:i + width] for i in range(0, len(tail), width)]
+        
+        community_data, transport = self._snmp_target(hostname, community)
+        errorIndication, errorStatus, errorIndex, varBindTable = await bulkCmd(
+            self.snmp_engine,
+            community_data,
+            transport,
+            self._snmp_context,
+            non_repeaters, max_repetitions,
+            *(_object_types(tuple(oids)) if memoize else _build_object_types(oids)),
+            lookupMib=False
+        )
+        
+        if errorIndication:
+            self.logger.debug(f"SNMP error indication: {errorIndication}")
+            return []
+        elif errorStatus:
+            self.logger.debug(f"SNMP error status: {errorStatus.prettyPrint()}")
+            return []
+        
+        return [[(str(name), str(value)) for name, value in varBinds] for varBinds in varBindTable]
+    
+    async def collect_device_metrics(self, device_info, ping_result=None, timestamp=None):
         """
         Collect comprehensive metrics from a device
         
         Args:
             device_info (dict): Device connection information
+            ping_result (dict): Result from ping_batch(), pinged individually if None
+            timestamp (str): Timestamp shared by the metrics and their ping result, now if None
             
         Returns:
             dict: Collected metrics and status
@@ -213,18 +836,42 @@ class NetworkMonitor:
         hostname = device_info.get('hostname', device_info['host'])
         host_ip = device_info['host']
         snmp_community = device_info.get('snmp_community', 'public')
+        timestamp = timestamp or datetime.now().isoformat()
         
         metrics = {
             'hostname': hostname,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'connectivity': {},
             'performance': {},
             'interfaces': {},
             'system': {}
         }
         
+        # System, performance and interface OIDs, walked with GetBulkRequests
+        bulk_request = (host_ip, snmp_community, BULK_SCALAR_OIDS, BULK_COLUMN_OIDS, INTERFACE_BULK_REPETITIONS)
+        
         # 1. Connectivity Test
-        ping_result = self.ping_device(host_ip)
+        if ping_result is None:
+            # SNMP starts on the first echo reply, so a live device's
+            # remaining probes overlap the bulk walk and a down device
+            # gets no SNMP requests at all
+            first_reply = asyncio.Event()
+            ping_task = asyncio.ensure_future(self.ping_device(host_ip, timestamp=timestamp, first_reply=first_reply))
+            reply_task = asyncio.ensure_future(first_reply.wait())
+            try:
+                await asyncio.wait((ping_task, reply_task), return_when=asyncio.FIRST_COMPLETED)
+                if first_reply.is_set():
+                    ping_result, (scalars, columns) = await asyncio.gather(
+                        ping_task,
+                        self.get_snmp_bulk(*bulk_request)
+                    )
+                else:
+                    ping_result = ping_task.result()
+            finally:
+                ping_task.cancel()
+                reply_task.cancel()
+        elif ping_result['status'] == 'up':
+            scalars, columns = await self.get_snmp_bulk(*bulk_request)
         metrics['connectivity'] = ping_result
         
         if ping_result['status'] != 'up':
@@ -232,25 +879,13 @@ class NetworkMonitor:
             return metrics
         
         # 2. SNMP System Information
-        system_oids = {
-            'sysUpTime': '1.3.6.1.2.1.1.3.0',
-            'sysDescr': '1.3.6.1.2.1.1.1.0',
-            'sysName': '1.3.6.1.2.1.1.5.0'
-        }
         
-        for metric_name, oid in system_oids.items():
-            value = self.get_snmp_metric(host_ip, snmp_community, oid)
-            metrics['system'][metric_name] = value
+        for metric_name, oid in SYSTEM_OIDS.items():
+            metrics['system'][metric_name] = scalars.get(oid)
         
         # 3. CPU and Memory (Cisco specific OIDs)
-        performance_oids = {
-            'cpu_5min': '1.3.6.1.4.1.9.9.109.1.1.1.1.8.1',  # Cisco CPU 5min avg
-            'memory_used': '1.3.6.1.4.1.9.9.48.1.1.1.5.1',   # Cisco memory used
-            'memory_free': '1.3.6.1.4.1.9.9.48.1.1.1.6.1'    # Cisco memory free
-        }
-        
-        for metric_name, oid in performance_oids.items():
-            value = self.get_snmp_metric(host_ip, snmp_community, oid)
+        for metric_name, oid in PERFORMANCE_OIDS.items():
+            value = scalars.get(oid)
             if value:
                 try:
                     metrics['performance'][metric_name] = float(value)
@@ -265,22 +900,23 @@ class NetworkMonitor:
             if total > 0:
                 metrics['performance']['memory_percent'] = (used / total) * 100
         
-        # 4. Interface Statistics (basic check for first few interfaces)
-        interface_base_oid = '1.3.6.1.2.1.2.2.1'
+        # 4. Interface Statistics, keyed by ifIndex
         interface_metrics = {}
+        if_names = columns[INTERFACE_OIDS['name']]
+        if_statuses = columns[INTERFACE_OIDS['status']]
+        if_speeds = columns[INTERFACE_OIDS['speed']]
         
-        # Check first 5 interfaces
-        for i in range(1, 6):
-            if_name = self.get_snmp_metric(host_ip, snmp_community, f'{interface_base_oid}.2.{i}')
-            if_status = self.get_snmp_metric(host_ip, snmp_community, f'{interface_base_oid}.8.{i}')
-            if_speed = self.get_snmp_metric(host_ip, snmp_community, f'{interface_base_oid}.5.{i}')
+        for if_index, if_name in if_names.items():
+            is_ethernet = self._ethernet_cache.get((hostname, if_name))
+            if is_ethernet is None:
+                is_ethernet = self._ethernet_cache[(hostname, if_name)] = 'Ethernet' in if_name
             
-            if if_name:
-                interface_metrics[f'interface_{i}'] = {
-                    'name': if_name,
-                    'status': 'up' if if_status == '1' else 'down',
-                    'speed': if_speed
-                }
+            interface_metrics[f'interface_{if_index}'] = {
+                'name': if_name,
+                'status': 'up' if if_statuses.get(if_index) == '1' else 'down',
+                'speed': if_speeds.get(if_index),
+                'is_ethernet': is_ethernet
+            }
         
         metrics['interfaces'] = interface_metrics
         metrics['overall_status'] = 'up'
@@ -297,83 +933,108 @@ class NetworkMonitor:
         Returns:
             list: List of generated alerts
         """
-        alerts = []
-        hostname = metrics['hostname']
-        timestamp = metrics['timestamp']
+        return self.evaluate_fleet_alerts([metrics])
+    
+    def evaluate_fleet_alerts(self, metrics_list):
+        """
+        Evaluate the metrics of many devices against thresholds at once
         
-        # Connectivity alerts
-        if metrics['connectivity']['status'] != 'up':
-            alert = {
-                'hostname': hostname,
-                'severity': 'critical',
-                'type': 'connectivity',
-                'message': f"Device {hostname} is unreachable",
-                'details': metrics['connectivity'],
-                'timestamp': timestamp
-            }
-            alerts.append(alert)
-            return alerts  # If device is down, don't check other metrics
+        Each threshold is checked for the whole fleet in one NumPy comparison;
+        only devices with a raised mask are visited to build their alerts.
         
-        # High latency alert
-        if metrics['connectivity']['avg_latency'] > 100:
-            alerts.append({
-                'hostname': hostname,
-                'severity': 'warning',
-                'type': 'latency',
-                'message': f"High latency detected: {metrics['connectivity']['avg_latency']:.1f}ms",
-                'timestamp': timestamp
-            })
-        
-        # CPU alerts
-        if 'cpu_5min' in metrics['performance']:
-            cpu_usage = metrics['performance']['cpu_5min']
-            if cpu_usage > self.thresholds['cpu_critical']:
+        Args:
+            metrics_list (list): Metrics of every device polled in a cycle
+            
+        Returns:
+            list: List of generated alerts, grouped by device
+        """
+        metrics_list = [metrics for metrics in metrics_list if metrics['overall_status'] != 'error']
+        if not metrics_list:
+            return []
+        
+        up = np.array([metrics['connectivity']['status'] == 'up' for metrics in metrics_list])
+        latency = np.array([metrics['connectivity']['avg_latency'] for metrics in metrics_list], dtype=np.float64)
+        cpu = np.array([_as_float(metrics['performance'].get('cpu_5min')) for metrics in metrics_list])
+        memory = np.array([_as_float(metrics['performance'].get('memory_percent')) for metrics in metrics_list])
+        interfaces_down = np.array([
+            any(if_info['status'] == 'down' and if_info['is_ethernet']
+                for if_info in metrics['interfaces'].values())
+            for metrics in metrics_list
+        ])
+        
+        # If a device is down, don't check other metrics; missing values are
+        # NaN and never exceed a threshold
+        down_mask = ~up
+        latency_mask = up & (latency > 100)
+        cpu_critical = up & (cpu > self.thresholds['cpu_critical'])
+        cpu_warning = up & ~cpu_critical & (cpu > self.thresholds['cpu_warning'])
+        memory_critical = up & (memory > self.thresholds['memory_critical'])
+        memory_warning = up & ~memory_critical & (memory > self.thresholds['memory_warning'])
+        interface_mask = up & interfaces_down
+        
+        alerts = []
+        flagged = (down_mask | latency_mask | cpu_critical | cpu_warning
+                   | memory_critical | memory_warning | interface_mask)
+        for i in np.flatnonzero(flagged):
+            metrics = metrics_list[i]
+            hostname = metrics['hostname']
+            timestamp = metrics['timestamp']
+            
+            # Connectivity alerts
+            if down_mask[i]:
                 alerts.append({
                     'hostname': hostname,
                     'severity': 'critical',
-                    'type': 'cpu',
-                    'message': f"Critical CPU usage: {cpu_usage:.1f}%",
+                    'type': 'connectivity',
+                    'message': f"Device {hostname} is unreachable",
+                    'details': metrics['connectivity'],
                     'timestamp': timestamp
                 })
-            elif cpu_usage > self.thresholds['cpu_warning']:
+                continue
+            
+            # High latency alert
+            if latency_mask[i]:
                 alerts.append({
                     'hostname': hostname,
                     'severity': 'warning',
-                    'type': 'cpu',
-                    'message': f"High CPU usage: {cpu_usage:.1f}%",
+                    'type': 'latency',
+                    'message': f"High latency detected: {metrics['connectivity']['avg_latency']:.1f}ms",
                     'timestamp': timestamp
                 })
-        
-        # Memory alerts
-        if 'memory_percent' in metrics['performance']:
-            memory_usage = metrics['performance']['memory_percent']
-            if memory_usage > self.thresholds['memory_critical']:
+            
+            # CPU alerts
+            if cpu_critical[i] or cpu_warning[i]:
+                cpu_usage = metrics['performance']['cpu_5min']
                 alerts.append({
                     'hostname': hostname,
-                    'severity': 'critical',
-                    'type': 'memory',
-                    'message': f"Critical memory usage: {memory_usage:.1f}%",
+                    'severity': 'critical' if cpu_critical[i] else 'warning',
+                    'type': 'cpu',
+                    'message': f"{'Critical' if cpu_critical[i] else 'High'} CPU usage: {cpu_usage:.1f}%",
                     'timestamp': timestamp
                 })
-            elif memory_usage > self.thresholds['memory_warning']:
+            
+            # Memory alerts
+            if memory_critical[i] or memory_warning[i]:
+                memory_usage = metrics['performance']['memory_percent']
                 alerts.append({
                     'hostname': hostname,
-                    'severity': 'warning',
+                    'severity': 'critical' if memory_critical[i] else 'warning',
                     'type': 'memory',
-                    'message': f"High memory usage: {memory_usage:.1f}%",
-                    'timestamp': timestamp
-                })
-        
-        # Interface down alerts
-        for if_id, if_info in metrics['interfaces'].items():
-            if if_info['status'] == 'down' and 'Ethernet' in if_info['name']:
-                alerts.append({
-                    'hostname': hostname,
-                    'severity': 'warning',
-                    'type': 'interface',
-                    'message': f"Interface {if_info['name']} is down",
+                    'message': f"{'Critical' if memory_critical[i] else 'High'} memory usage: {memory_usage:.1f}%",
                     'timestamp': timestamp
                 })
+            
+            # Interface down alerts
+            if interface_mask[i]:
+                for if_id, if_info in metrics['interfaces'].items():
+                    if if_info['status'] == 'down' and if_info['is_ethernet']:
+                        alerts.append({
+                            'hostname': hostname,
+                            'severity': 'warning',
+                            'type': 'interface',
+                            'message': f"Interface {if_info['name']} is down",
+                            'timestamp': timestamp
+                        })
         
         return alerts
     
@@ -399,48 +1060,196 @@ class NetworkMonitor:
             
             self.logger.info(f"Alert generated: {alert['type']} - {alert['message']}")
     
-    def monitor_device(self, device_info):
+    async def poll_device(self, device_info, ping_result=None, timestamp=None):
         """
-        Monitor a single device
+        Collect metrics from a single device without recording them
         
         Args:
             device_info (dict): Device information
+            ping_result (dict): Result from ping_batch(), pinged individually if None
+            timestamp (str): Cycle timestamp, now if None
+            
+        Returns:
+            dict: Collected metrics, or an error entry if collection failed or timed out
         """
         hostname = device_info.get('hostname', device_info['host'])
+        timestamp = timestamp or datetime.now().isoformat()
         
         try:
-            # Collect metrics
-            metrics = self.collect_device_metrics(device_info)
+            return await asyncio.wait_for(
+                self.collect_device_metrics(device_info, ping_result, timestamp), DEVICE_TIMEOUT
+            )
             
-            # Store metrics
-            self.devices_status[hostname] = metrics
-            self.metrics_history[hostname].append(metrics)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                error_msg = f"Monitoring {hostname} exceeded {DEVICE_TIMEOUT}s timeout"
+            else:
+                error_msg = f"Error monitoring {hostname}: {str(e)}"
+            self.logger.error(error_msg)
             
-            # Evaluate alerts
+            # Create error metrics entry
+            return {
+                'hostname': hostname,
+                'timestamp': timestamp,
+                'overall_status': 'error',
+                'error': error_msg
+            }
+    
+    def record_metrics(self, metrics, evaluate=True, devices_status=None):
+        """
+        Store a device's metrics and raise its alerts
+        
+        Args:
+            metrics (dict): Metrics returned by poll_device()
+            evaluate (bool): Evaluate alerts now, False when the cycle evaluates the whole fleet
+            devices_status (dict): Status dict to store into, self.devices_status if None
+        """
+        hostname = metrics['hostname']
+        if devices_status is None:
+            devices_status = self.devices_status
+        devices_status[hostname] = metrics
+        if metrics['overall_status'] == 'error':
+            return
+        
+        # Keep only the trend scalars in history, the full dict is the current snapshot
+        self.metrics_history[hostname].append(metrics)
+        
+        # Evaluate alerts
+        if evaluate:
             alerts = self.evaluate_alerts(metrics)
             
             # Process alerts
             if alerts:
                 self.process_alerts(alerts)
+        
+        # Log successful monitoring
+        status_symbol = "✅" if metrics['overall_status'] == 'up' else "❌"
+        self.logger.info(f"{status_symbol} Monitored {hostname}: {metrics['overall_status']}")
+    
+    async def monitor_device(self, device_info, ping_result=None, timestamp=None):
+        """
+        Monitor a single device
+        
+        Args:
+            device_info (dict): Device information
+            ping_result (dict): Result from ping_batch(), pinged individually if None
+            timestamp (str): Cycle timestamp, now if None
+        """
+        self.record_metrics(await self.poll_device(device_info, ping_result, timestamp))
+    
+    async def _gather_devices(self, devices, handler):
+        """
+        Run handler(device, ping_result, timestamp) for every device, bounded
+        
+        Every device of the cycle shares one timestamp.
+        
+        Returns:
+            list: Handler results in device order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DEVICES)
+        timestamp = datetime.now().isoformat()
+        
+        # With system ping, one fping run covers the whole fleet; hosts it
+        # could not report on are pinged one by one
+        ping_results = {}
+        if self.pinger is None:
+            ping_results = await self.ping_batch([device['host'] for device in devices], timestamp=timestamp)
+        
+        async def bounded(device):
+            async with semaphore:
+                return await handler(device, ping_results.get(device['host']), timestamp)
+        
+        return await asyncio.gather(*(bounded(device) for device in devices))
+    
+    async def collect_cycle(self, devices):
+        """
+        Poll all devices once and return their metrics without recording them
+        
+        Args:
+            devices (list): List of devices to poll
             
-            # Log successful monitoring
-            status_symbol = "✅" if metrics['overall_status'] == 'up' else "❌"
-            self.logger.info(f"{status_symbol} Monitored {hostname}: {metrics['overall_status']}")
+        Returns:
+            list: Metrics of every device, error entries for those that failed or timed out
+        """
+        return await self._gather_devices(devices, self.poll_device)
+    
+    async def run_cycle(self, devices):
+        """
+        Monitor all devices once, concurrently on the event loop
+        
+        With more than one process the fleet is split into shards polled by
+        worker processes; their metrics are recorded here in the parent.
+        Alerts are evaluated for the whole fleet once the cycle is complete.
+        
+        Args:
+            devices (list): List of devices to monitor
+        """
+        if self.processes <= 1 or len(devices) <= 1:
+            cycle_metrics = await self.collect_cycle(devices)
+        else:
+            cycle_metrics = await self._collect_sharded(devices)
+        
+        # Merge the cycle into a copy of the status and publish it with one
+        # swap, so a report never sees a cycle half applied
+        devices_status = dict(self.devices_status)
+        for metrics in cycle_metrics:
+            self.record_metrics(metrics, evaluate=False, devices_status=devices_status)
+        self.devices_status = devices_status
+        
+        alerts = self.evaluate_fleet_alerts(cycle_metrics)
+        if alerts:
+            self.process_alerts(alerts)
+    
+    async def _collect_sharded(self, devices):
+        """
+        Poll the fleet in worker processes, one shard of devices each
+        
+        Args:
+            devices (list): List of devices to poll
             
-        except Exception as e:
-            error_msg = f"Error monitoring {hostname}: {str(e)}"
-            self.logger.error(error_msg)
+        A shard whose worker fails, for example because it crashed, reports
+        its devices as errors for the cycle; a broken pool is rebuilt on the
+        next cycle.
+        
+        Returns:
+            list: Metrics of every device, error entries for those that failed or timed out
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_init_worker,
+                initargs=(self.use_system_ping,)
+            )
+        
+        loop = asyncio.get_running_loop()
+        shards = [devices[i::self.processes] for i in range(min(self.processes, len(devices)))]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._process_pool, _collect_shard, shard) for shard in shards),
+            return_exceptions=True
+        )
+        
+        cycle_metrics = []
+        timestamp = datetime.now().isoformat()
+        for shard, shard_metrics in zip(shards, results):
+            if not isinstance(shard_metrics, BaseException):
+                cycle_metrics.extend(shard_metrics)
+                continue
             
-            # Create error metrics entry
-            error_metrics = {
-                'hostname': hostname,
-                'timestamp': datetime.now().isoformat(),
-                'overall_status': 'error',
-                'error': error_msg
-            }
-            self.devices_status[hostname] = error_metrics
+            self.logger.error(f"Worker process failed polling {len(shard)} devices: {shard_metrics!r}")
+            if isinstance(shard_metrics, BrokenProcessPool) and self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+            for device_info in shard:
+                hostname = device_info.get('hostname', device_info['host'])
+                cycle_metrics.append({
+                    'hostname': hostname,
+                    'timestamp': timestamp,
+                    'overall_status': 'error',
+                    'error': f"Error monitoring {hostname}: worker process failed: {shard_metrics!r}"
+                })
+        return cycle_metrics
     
-    def monitoring_loop(self, devices):
+    async def monitoring_loop(self, devices):
         """
         Main monitoring loop
         
@@ -454,15 +1263,7 @@ class NetworkMonitor:
             start_time = time.time()
             
             # Monitor all devices concurrently
-            threads = []
-            for device in devices:
-                thread = threading.Thread(target=self.monitor_device, args=(device,))
-                threads.append(thread)
-                thread.start()
-            
-            # Wait for all monitoring threads to complete
-            for thread in threads:
-                thread.join(timeout=30)  # 30 second timeout per device
+            await self.run_cycle(devices)
             
             # Calculate sleep time to maintain interval
             elapsed = time.time() - start_time
@@ -470,7 +1271,7 @@ class NetworkMonitor:
             
             if sleep_time > 0:
                 self.logger.debug(f"Monitoring cycle completed in {elapsed:.1f}s, sleeping for {sleep_time:.1f}s")
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
             else:
                 self.logger.warning(f"Monitoring cycle took {elapsed:.1f}s, exceeding interval of {self.monitoring_interval}s")
     
@@ -486,23 +1287,28 @@ class NetworkMonitor:
                                   if status.get('overall_status') == 'down'),
                 'devices_error': sum(1 for status in self.devices_status.values() 
                                    if status.get('overall_status') == 'error'),
-                'active_alerts': len([alert for alert in self.alerts_queue 
-                                    if alert['severity'] == 'critical'])
+                'active_alerts': self.alerts_queue.critical
             },
             'devices': self.devices_status,
-            'recent_alerts': list(self.alerts_queue)[-10:]  # Last 10 alerts
+            'recent_alerts': self.alerts_queue.recent(10)  # Last 10 alerts
         }
         
         return report
     
-    def save_report(self, report, filename=None):
-        """Save report to file"""
+    def save_report(self, report, filename=None, pretty=False):
+        """Save report to file, compact unless pretty is set"""
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"data/reports/network_status_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            # Streamed to disk as it is encoded, the whole JSON text never sits in memory
+            encoder = json.JSONEncoder(indent=2) if pretty else json.JSONEncoder(separators=(',', ':'))
+            with open(filename, 'w', buffering=REPORT_BUFFER_SIZE) as f:
+                f.writelines(encoder.iterencode(report))
         
         self.logger.info(f"Report saved to {filename}")
         return filename
@@ -511,6 +1317,46 @@ class NetworkMonitor:
         """Stop the monitoring loop"""
         self.monitoring_active = False
         self.logger.info("Monitoring stopped")
+    
+    def close(self):
+        """Shut down worker processes and threads and close the SNMP and ICMP sockets; safe to call twice"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        self._thread_pool.shutdown(wait=False)
+        
+        self._close_snmp_engine()
+        self._close_aiosnmp()
+        
+        if self.pinger is not None:
+            self.pinger.close()
+            self.pinger = None
+
+
+# Per worker process state for NetworkMonitor(processes=N): one monitor and
+# one event loop, reused across cycles so SNMP and ICMP sockets stay open
+_worker_monitor = None
+_worker_loop = None
+
+
+def _init_worker(use_system_ping):
+    """Process pool initializer creating the worker's monitor and event loop"""
+    global _worker_monitor, _worker_loop
+    _worker_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_monitor = NetworkMonitor(use_system_ping=use_system_ping)
+
+
+def _collect_shard(devices):
+    """Poll a shard of devices in a worker process, returning their metrics"""
+    return _worker_loop.run_until_complete(_worker_monitor.collect_cycle(devices))
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if uvloop:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 
 def main():
@@ -522,11 +1368,17 @@ def main():
     parser.add_argument('--device', help='Monitor single device by hostname')
     parser.add_argument('--report', action='store_true', help='Generate status report only')
     parser.add_argument('--continuous', action='store_true', help='Run continuous monitoring')
+    parser.add_argument('--use-system-ping', action='store_true',
+                        help='Ping with fping/ping subprocesses instead of an ICMP socket')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the saved report for reading instead of writing it compact')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Worker processes to spread devices across (default: 1)')
     
     args = parser.parse_args()
     
     # Initialize monitor
-    monitor = NetworkMonitor(args.interval)
+    monitor = NetworkMonitor(args.interval, use_system_ping=args.use_system_ping, processes=args.processes)
     
     try:
         # Get devices from config
@@ -548,12 +1400,11 @@ def main():
             print("Generating network status report...")
             
             # Monitor all devices once
-            for device in devices:
-                monitor.monitor_device(device)
+            _run(monitor.run_cycle(devices))
             
             # Generate and save report
             report = monitor.generate_status_report()
-            report_file = monitor.save_report(report)
+            report_file = monitor.save_report(report, pretty=args.pretty)
             
             # Display summary
             print(f"\n📊 NETWORK STATUS SUMMARY")
@@ -572,7 +1423,7 @@ def main():
             print("Press Ctrl+C to stop")
             
             try:
-                monitor.monitoring_loop(devices)
+                _run(monitor.monitoring_loop(devices))
             except KeyboardInterrupt:
                 print("\nStopping monitoring...")
                 monitor.stop_monitoring()
@@ -581,8 +1432,7 @@ def main():
             # Single monitoring cycle
             print("Performing single monitoring cycle...")
             
-            for device in devices:
-                monitor.monitor_device(device)
+            _run(monitor.run_cycle(devices))
             
             # Display results
             report = monitor.generate_status_report()
@@ -610,6 +1460,8 @@ def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         monitor.logger.error(f"Unexpected error: {str(e)}")
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ fi
 # 2. Instalar dependencias faltantes
 echo "📦 Instalando dependencias completas..."
 pip install --upgrade pip
-pip install netmiko pysnmp requests paramiko textfsm ntc-templates
+pip install netmiko "pysnmp>=6.0,<7" numpy requests paramiko textfsm ntc-templates
 
 # 3. Verificar instalación
 echo "🔍 Verificando instalación..."
@@ -25,11 +25,13 @@ try:
     import pysnmp
     import requests
     import paramiko
+    import numpy
     print('✅ Todas las librerías instaladas correctamente')
     print(f'   - netmiko: {netmiko.__version__}')
     print(f'   - requests: {requests.__version__}')
     print('   - pysnmp: OK')
     print('   - paramiko: OK')
+    print(f'   - numpy: {numpy.__version__}')
 except ImportError as e:
     print(f'❌ Error de importación: {e}')
 "